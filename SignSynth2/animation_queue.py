@@ -0,0 +1,108 @@
+import threading
+import time
+from collections import deque
+
+
+class AnimationQueue:
+    """Bounded, thread-safe queue of committed gloss segments awaiting the avatar
+
+    The speech thread pushes segments; the render loop pops them. When the
+    queue is full the oldest segment is dropped, so the avatar never falls
+    arbitrarily far behind the speaker.
+    """
+
+    def __init__(self, max_segments=8):
+        self.max_segments = max_segments
+        self.segments = deque()
+        self.lock = threading.Lock()
+
+        # Segments pushed out by a full queue, kept until take_overflowed() reports them
+        self.overflowed = []
+
+        # Latency bookkeeping, all in seconds
+        self.pushed = 0
+        self.dropped = 0
+        self.started = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self.total_lag = 0.0
+
+    def push(self, gloss, spoken_at=None):
+        """Queue a gloss segment; spoken_at is its time.monotonic() timestamp"""
+        if not gloss:
+            return
+        if spoken_at is None:
+            spoken_at = time.monotonic()
+
+        with self.lock:
+            self.segments.append((gloss, spoken_at))
+            self.pushed += 1
+            while len(self.segments) > self.max_segments:
+                self.overflowed.append(self.segments.popleft())
+                self.dropped += 1
+
+    def pop(self):
+        """Return the oldest (gloss, spoken_at) pair, or None if empty"""
+        with self.lock:
+            if not self.segments:
+                return None
+            return self.segments.popleft()
+
+    def mark_started(self, spoken_at):
+        """Record that the avatar started signing a segment spoken at spoken_at"""
+        lag = time.monotonic() - spoken_at
+        with self.lock:
+            self.started += 1
+            self.last_lag = lag
+            self.total_lag += lag
+            self.max_lag = max(self.max_lag, lag)
+        return lag
+
+    def snapshot(self):
+        """Return a copy of the waiting (gloss, spoken_at) pairs, oldest first"""
+        with self.lock:
+            return list(self.segments)
+
+    def drop_stale(self, max_age):
+        """Drop waiting segments older than max_age seconds, always keeping the newest
+
+        Returns the dropped (gloss, spoken_at) pairs so the caller can report them.
+        """
+        now = time.monotonic()
+        dropped = []
+        with self.lock:
+            while len(self.segments) > 1 and now - self.segments[0][1] > max_age:
+                dropped.append(self.segments.popleft())
+            self.dropped += len(dropped)
+        return dropped
+
+    def take_overflowed(self):
+        """Return and forget the (gloss, spoken_at) pairs a full queue has dropped"""
+        with self.lock:
+            overflowed = self.overflowed
+            self.overflowed = []
+        return overflowed
+
+    def depth(self):
+        """Return the number of segments waiting"""
+        return len(self.segments)
+
+    def clear(self):
+        """Drop every waiting segment"""
+        with self.lock:
+            self.segments.clear()
+
+    def stats(self):
+        """Return queue depth and lag-behind-speech figures"""
+        with self.lock:
+            oldest_age = time.monotonic() - self.segments[0][1] if self.segments else 0.0
+            return {
+                "depth": len(self.segments),
+                "max_segments": self.max_segments,
+                "pushed": self.pushed,
+                "dropped": self.dropped,
+                "oldest_age": oldest_age,
+                "last_lag": self.last_lag,
+                "mean_lag": self.total_lag / self.started if self.started else 0.0,
+                "max_lag": self.max_lag
+            }
@@ -0,0 +1,73 @@
+import time
+
+import numpy as np
+
+from pose_library import JOINT_LAYOUT
+
+# Scene-graph node name prefix of each finger; segments are numbered from 1 (t1, t2, i1, ...)
+FINGER_NODE_PREFIXES = {"thumb": "t", "index": "i", "middle": "m", "ring": "r", "pinky": "p"}
+
+
+class AvatarRig:
+    """The avatar's joints resolved once into a flat list in JOINT_LAYOUT order
+
+    Each arm's subtree is walked a single time and its finger nodes picked
+    out by name, instead of one recursive find() per joint. Joint i of the
+    rig is row i of every compiled pose array, so applying a pose is one
+    indexed loop. Resolve time and per-apply cost are tracked in stats().
+    """
+
+    def __init__(self, left_arm, right_arm):
+        started = time.perf_counter()
+        arms = {"leftHand": left_arm, "rightHand": right_arm}
+
+        # One subtree walk per arm: node name -> first NodePath with that name
+        nodes = {}
+        for hand, arm in arms.items():
+            nodes[hand] = {}
+            for node in arm.findAllMatches("**"):
+                nodes[hand].setdefault(node.getName(), node)
+
+        self.joints = []
+        missing = []
+        for hand, part, segment in JOINT_LAYOUT:
+            if part == "arm":
+                self.joints.append(arms[hand])
+                continue
+            name = f"{FINGER_NODE_PREFIXES[part]}{segment + 1}"
+            joint = nodes[hand].get(name)
+            if joint is None:
+                missing.append(f"{hand}/{name}")
+            self.joints.append(joint)
+        if missing:
+            raise ValueError(f"Avatar rig is missing joints: {', '.join(missing)}")
+
+        self.resolve_time = time.perf_counter() - started
+
+        # Apply cost bookkeeping, in seconds
+        self.applies = 0
+        self.apply_time = 0.0
+
+    def read(self):
+        """Return the rig's current transforms as a [joint, pos/hpr, xyz] array"""
+        return np.array([[joint.getPos(), joint.getHpr()] for joint in self.joints], dtype=np.float32)
+
+    def apply(self, pose):
+        """Write a fully specified [joint, pos/hpr, xyz] array to the rig"""
+        started = time.perf_counter()
+        joints = self.joints
+        values = pose.tolist()
+        for index in range(len(joints)):
+            pos, hpr = values[index]
+            joints[index].setPosHpr(*pos, *hpr)
+        self.applies += 1
+        self.apply_time += time.perf_counter() - started
+
+    def stats(self):
+        """Return joint count, resolve time and mean apply cost in milliseconds"""
+        return {
+            "joints": len(self.joints),
+            "resolve_ms": self.resolve_time * 1000,
+            "applies": self.applies,
+            "mean_apply_ms": self.apply_time / self.applies * 1000 if self.applies else 0.0
+        }
@@ -0,0 +1,110 @@
+import os
+import shutil
+import time
+
+import numpy as np
+from direct.interval.IntervalGlobal import Parallel, Sequence, Wait
+from direct.interval.LerpInterval import LerpPosHprInterval
+from panda3d.core import LVecBase3f
+
+from lru_cache import LRUCache
+from pose_library import MODULE_DIR, HPR
+
+# Where earlier versions saved baked keyframe tables; removed on startup
+LEGACY_CLIP_DIR = os.path.join(MODULE_DIR, "clip_cache")
+
+
+def bake_keyframes(poses):
+    """Resolve a sign's keyframes into absolute per-joint targets
+
+    Joints a keyframe leaves unset (NaN) carry over from the previous
+    keyframe, and each rotation is unwrapped against the previous keyframe so
+    the lerp takes the short way. Joints still unset in the first keyframe
+    stay NaN and are left alone during playback.
+    """
+    targets = np.array(poses, dtype=np.float32)
+    for k in range(1, len(targets)):
+        previous = targets[k - 1]
+        targets[k] = np.where(np.isnan(targets[k]), previous, targets[k])
+        delta = (targets[k, :, HPR] - previous[:, HPR] + 180.0) % 360.0 - 180.0
+        targets[k, :, HPR] = np.where(np.isnan(previous[:, HPR]), targets[k, :, HPR], previous[:, HPR] + delta)
+    return targets
+
+
+class ClipBaker:
+    """Bakes signs into native Panda3D intervals, kept in an in-memory LRU
+
+    A clip is one LerpPosHprInterval per joint per keyframe, grouped into a
+    Sequence of Parallels. Once started, the engine's C++ interval manager
+    steps it; Python only starts one clip per sign. The first keyframe lerps
+    from wherever the rig is, so a clip follows any previous sign without
+    baking every pair; later keyframes start from the baked previous one.
+
+    Intervals can't be saved, and the keyframe tables behind them are cheaper
+    to recompute than to read back, so nothing is written to disk: built
+    intervals are kept in an LRU bounded by max_clips, keyed by pose ids and
+    timing (pose ids are fixed for the library the baker was made with).
+    """
+
+    def __init__(self, library, joints, max_clips=128):
+        self.library = library
+        self.joints = joints
+        self.clips = LRUCache(max_clips)  # (pose ids, durations, transition) -> interval
+
+        # Bake counters; bake_time in seconds
+        self.bakes = 0
+        self.bake_time = 0.0
+
+        shutil.rmtree(LEGACY_CLIP_DIR, ignore_errors=True)
+
+    def bake(self, pose_ids, durations, transition):
+        """Resolve a sign's keyframes and build its interval"""
+        started = time.perf_counter()
+        targets = bake_keyframes([self.library.pose(pose_id) for pose_id in pose_ids])
+        clip = self.build(targets, durations, transition)
+        self.bakes += 1
+        self.bake_time += time.perf_counter() - started
+        return clip
+
+    def build(self, targets, durations, transition):
+        """Turn baked targets into a Sequence of per-keyframe Parallels"""
+        steps = []
+        previous = None
+        for target, duration in zip(targets.tolist(), durations):
+            lerp_time = min(transition, duration)
+            lerps = []
+            for index, joint in enumerate(self.joints):
+                pos, hpr = target[index]
+                if pos[0] != pos[0]:  # NaN: joint not set by this sign
+                    continue
+                if previous is None or previous[index][0][0] != previous[index][0][0]:
+                    lerps.append(LerpPosHprInterval(joint, lerp_time, LVecBase3f(*pos), LVecBase3f(*hpr),
+                                                    blendType="easeInOut"))
+                else:
+                    start_pos, start_hpr = previous[index]
+                    lerps.append(LerpPosHprInterval(joint, lerp_time, LVecBase3f(*pos), LVecBase3f(*hpr),
+                                                    startPos=LVecBase3f(*start_pos),
+                                                    startHpr=LVecBase3f(*start_hpr), blendType="easeInOut"))
+            steps.append(Parallel(*lerps))
+            if duration > lerp_time:
+                steps.append(Wait(duration - lerp_time))
+            previous = target
+        return Sequence(*steps)
+
+    def clip(self, pose_ids, durations, transition):
+        """Return the interval for one sign at normal speed, baking it on first use"""
+        key = (tuple(pose_ids), tuple(durations), round(transition, 4))
+        clip = self.clips.get(key)
+        if clip is None:
+            clip = self.bake(pose_ids, durations, transition)
+            self.clips.put(key, clip)
+        return clip
+
+    def stats(self):
+        """Return clip cache counters and mean bake cost in milliseconds"""
+        return {
+            "clips": len(self.clips),
+            "hits": self.clips.hits,
+            "bakes": self.bakes,
+            "mean_bake_ms": self.bake_time / self.bakes * 1000 if self.bakes else 0.0
+        }
@@ -0,0 +1,140 @@
+import argparse
+import math
+import time
+
+import numpy as np
+from panda3d.core import (loadPrcFileData, AmbientLight, DirectionalLight, GraphicsOutput,
+                          NodePath, Texture)
+
+from avatar_rig import AvatarRig
+from model_cache import ModelCache, AVATAR_MODELS
+from playback_scheduler import BASE_TRANSITION
+from pose_animator import PoseAnimator
+from sign_timeline import SignTimeline
+
+
+class HeadlessRenderer:
+    """Renders the signing avatar offscreen with the software renderer
+
+    No display or GPU is needed: the scene is drawn by p3tinydisplay into an
+    offscreen buffer of a fixed size and copied to RAM each frame. frames()
+    plays a gloss on a fixed frame clock (not wall time), so output is
+    deterministic and rendering can run as fast as the CPU allows. Only one
+    renderer can exist per process, since it owns the ShowBase.
+    """
+
+    def __init__(self, width=640, height=480, fps=30):
+        self.width = width
+        self.height = height
+        self.fps = fps
+
+        loadPrcFileData("headless", f"""
+            window-type offscreen
+            load-display p3tinydisplay
+            audio-library-name null
+            win-size {width} {height}
+            sync-video false
+        """)
+        from direct.showbase.ShowBase import ShowBase
+        self.base = ShowBase()
+        self.base.setBackgroundColor(0.9, 0.9, 0.9, 1)
+
+        # Each rendered frame is copied into this texture's RAM image
+        self.texture = Texture("headless_frame")
+        self.base.win.addRenderTexture(self.texture, GraphicsOutput.RTMCopyRam)
+
+        # Same framing as the GUI's animation viewport
+        self.base.disableMouse()
+        self.base.cam.setPos(0, -15, 3.25)
+        self.base.cam.lookAt(0, 0, 3)
+
+        self.root = NodePath("headless_root")
+        self.root.reparentTo(self.base.render)
+        self.setup_lighting()
+
+        self.model_cache = ModelCache(self.base.loader)
+        torso, right_arm, left_arm = self.model_cache.load(AVATAR_MODELS)
+        torso.reparentTo(self.root)
+        right_arm.reparentTo(torso)
+        left_arm.reparentTo(torso)
+
+        self.rig = AvatarRig(left_arm, right_arm)
+        self.animator = PoseAnimator(self.rig)
+        self.animator.applyDefaultPose()
+
+        # Frames rendered and seconds spent rendering them
+        self.frames_rendered = 0
+        self.render_time = 0.0
+
+    def setup_lighting(self):
+        """Directional plus ambient light; no shadows, the software renderer can't draw them"""
+        main_light = self.root.attachNewNode(DirectionalLight("main light"))
+        main_light.setHpr(0, -70, 0)
+        self.root.setLight(main_light)
+
+        ambient = AmbientLight("ambient light")
+        ambient.setColor((0.2, 0.2, 0.2, 1))
+        self.root.setLight(self.root.attachNewNode(ambient))
+
+    def render(self):
+        """Draw one frame and return it as a (height, width, 3) uint8 RGB array"""
+        started = time.perf_counter()
+        self.base.graphicsEngine.renderFrame()
+        image = np.frombuffer(self.texture.getRamImageAs("RGB"), dtype=np.uint8)
+        frame = image.reshape(self.texture.getYSize(), self.texture.getXSize(), 3)[::-1].copy()
+        self.frames_rendered += 1
+        self.render_time += time.perf_counter() - started
+        return frame
+
+    def duration(self, plan, hold_end=0.5):
+        """Return the seconds of output a plan renders to"""
+        return sum(plan.durations) + hold_end
+
+    def frames(self, gloss, hold_end=0.5, transition=BASE_TRANSITION):
+        """Yield one RGB frame per 1/fps seconds while the avatar signs gloss
+
+        The avatar starts from the default pose and holds the last sign for
+        hold_end seconds.
+        """
+        plan = self.animator.compilePlan(gloss)
+        blender = self.animator.blender
+        self.animator.applyDefaultPose()
+
+        timeline = SignTimeline()
+        timeline.load(plan, 0.0)
+        for index in range(math.ceil(self.duration(plan, hold_end) * self.fps)):
+            now = index / self.fps
+            step = timeline.advance(now)
+            if step is not None:
+                pose_id = plan.pose_ids[step]
+                self.animator.animatePose(self.animator.getPose(pose_id), min(transition, plan.durations[step]),
+                                          pose_id, timeline.starts[step])
+            blender.update(now)
+            yield self.render()
+
+    def stats(self):
+        """Return frames rendered and the mean rendering rate"""
+        return {
+            "frames": self.frames_rendered,
+            "fps": self.frames_rendered / self.render_time if self.render_time else 0.0,
+            "mean_frame_ms": self.render_time / self.frames_rendered * 1000 if self.frames_rendered else 0.0
+        }
+
+
+# Benchmark: render a gloss headlessly and report frames/sec
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render sign animation without a window")
+    parser.add_argument("gloss", nargs="?", default="HELLO ME WANT GO")
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--height", type=int, default=480)
+    parser.add_argument("--fps", type=int, default=30)
+    args = parser.parse_args()
+
+    renderer = HeadlessRenderer(args.width, args.height, args.fps)
+    started = time.perf_counter()
+    count = sum(1 for _ in renderer.frames(args.gloss))
+    elapsed = time.perf_counter() - started
+
+    print(f"Rendered {count} frames ({count / args.fps:.1f}s of output) at {args.width}x{args.height} "
+          f"in {elapsed:.2f}s: {count / elapsed:.1f} frames/sec, "
+          f"{count / args.fps / elapsed:.1f} output-seconds per second")
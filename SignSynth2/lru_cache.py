@@ -0,0 +1,80 @@
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """Bounded, thread-safe LRU map with hit, miss and eviction counters
+
+    Shared by the plan, pose, shard, transition and clip caches. Values are
+    built outside the lock (get_or_build), so a slow build doesn't block
+    readers; two threads missing on one key may both build it, and the
+    last put() wins. on_evict(key, value) is called for each entry pushed
+    out, outside the lock.
+    """
+
+    def __init__(self, max_size, on_evict=None):
+        self.max_size = max_size
+        self.on_evict = on_evict
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+        # Counters exposed through stats()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, count=True):
+        """Return the value for key and mark it recently used, or None; count=False skips the counters"""
+        with self.lock:
+            value = self.entries.get(key)
+            if value is not None:
+                self.entries.move_to_end(key)
+            if count:
+                if value is None:
+                    self.misses += 1
+                else:
+                    self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """Store a value, evicting the least recently used entries past max_size"""
+        evicted = []
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                evicted.append(self.entries.popitem(last=False))
+                self.evictions += 1
+        if self.on_evict:
+            for old_key, old_value in evicted:
+                self.on_evict(old_key, old_value)
+
+    def get_or_build(self, key, build):
+        """Return the cached value for key, calling build(key) and storing the result on a miss"""
+        value = self.get(key)
+        if value is None:
+            value = build(key)
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        """Drop every entry; counters are kept"""
+        with self.lock:
+            self.entries.clear()
+
+    def __len__(self):
+        with self.lock:
+            return len(self.entries)
+
+    def stats(self):
+        """Return hit/miss/eviction counters and the current size"""
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self.entries),
+                "max_size": self.max_size,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
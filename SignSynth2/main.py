@@ -1,3 +1,9 @@
+import os
+import sys
+
+# The app imports the gloss engine from the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 from speech_app_gui import SpeechAppGUI
 
 
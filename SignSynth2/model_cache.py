@@ -0,0 +1,134 @@
+import hashlib
+import os
+import tempfile
+import time
+
+from panda3d.core import Filename, Loader, NodePath
+
+MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+MODELS_DIR = os.path.join(MODULE_DIR, "models")
+
+# Native .bam copies of the shipped models (build output)
+DEFAULT_BAM_DIR = os.path.join(MODELS_DIR, "bam_cache")
+
+# Avatar parts, in the order load_avatar() hands them to its callback
+AVATAR_MODELS = ["torso.glb", "RArmX.glb", "LArmX.glb"]
+
+
+def content_hash(path):
+    """Return the sha1 of a file's contents"""
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(65536), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def prepare_bam_cache(names=AVATAR_MODELS, models_dir=MODELS_DIR, bam_dir=DEFAULT_BAM_DIR):
+    """Convert any of the named models that have no .bam copy yet; needs no ShowBase
+
+    Run it once before starting processes that each open a ModelCache, so
+    they only ever read finished copies. Returns the number converted.
+    """
+    cache = ModelCache(None, models_dir, bam_dir)
+    for name in names:
+        bam_path = cache.bam_path(name)
+        if not os.path.exists(bam_path):
+            node = Loader.getGlobalPtr().loadSync(Filename.fromOsSpecific(os.path.join(models_dir, name)))
+            if node is None:
+                print(f"Error loading model {name}")
+                continue
+            cache.convert(name, NodePath(node), bam_path)
+    return cache.conversions
+
+
+class ModelCache:
+    """Loads models from native .bam copies, converting each source file once
+
+    The .bam name carries the source's content hash, so editing a model
+    produces a new copy rather than a stale hit. Loads go through Panda3D's
+    asynchronous loader thread and finish with a callback on the main thread,
+    so the window keeps drawing while the avatar loads.
+    """
+
+    def __init__(self, loader, models_dir=MODELS_DIR, bam_dir=DEFAULT_BAM_DIR):
+        self.loader = loader
+        self.models_dir = models_dir
+        self.bam_dir = bam_dir
+
+        # Counters; load_time in seconds from request to callback
+        self.bam_hits = 0
+        self.conversions = 0
+        self.load_time = 0.0
+
+    def bam_path(self, name):
+        """Return the content-keyed .bam path for a model in models_dir"""
+        source = os.path.join(self.models_dir, name)
+        stem = os.path.splitext(name)[0]
+        return os.path.join(self.bam_dir, f"{stem}-{content_hash(source)[:16]}.bam")
+
+    def convert(self, name, model, bam_path):
+        """Write a freshly imported model out as .bam for the next start
+
+        Each conversion writes its own temporary file and renames it into
+        place, so processes converting the same model at once don't collide.
+        """
+        os.makedirs(self.bam_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(suffix=".bam", dir=self.bam_dir)
+        os.close(fd)
+        if model.writeBamFile(Filename.fromOsSpecific(tmp_path)):
+            os.replace(tmp_path, bam_path)
+            self.conversions += 1
+        else:
+            os.remove(tmp_path)
+            print(f"Error writing model cache for {name}")
+
+    def files(self, names):
+        """Return (files to load, .bam paths, cached flags); cached .bam copies skip the glTF importer"""
+        bam_paths = [self.bam_path(name) for name in names]
+        cached = [os.path.exists(path) for path in bam_paths]
+        files = [
+            Filename.fromOsSpecific(bam if hit else os.path.join(self.models_dir, name))
+            for name, bam, hit in zip(names, bam_paths, cached)
+        ]
+        return files, bam_paths, cached
+
+    def finish(self, names, models, bam_paths, cached, started):
+        """Count hits, convert freshly imported models and record the load time"""
+        for name, model, bam, hit in zip(names, models, bam_paths, cached):
+            if hit:
+                self.bam_hits += 1
+            elif model is not None:
+                self.convert(name, model, bam)
+        self.load_time = time.perf_counter() - started
+
+    def load(self, names):
+        """Load models on this thread and return them in the same order"""
+        started = time.perf_counter()
+        files, bam_paths, cached = self.files(names)
+        models = [self.loader.loadModel(path, noCache=True) for path in files]
+        self.finish(names, models, bam_paths, cached, started)
+        return models
+
+    def load_async(self, names, callback):
+        """Load models in the background and call callback(models) in the same order"""
+        started = time.perf_counter()
+        files, bam_paths, cached = self.files(names)
+
+        def loaded(models):
+            self.finish(names, models, bam_paths, cached, started)
+            callback(models)
+
+        return self.loader.loadModel(files, callback=loaded, noCache=True)
+
+    def load_avatar(self, callback):
+        """Load the torso and both arms; callback receives [torso, right arm, left arm]"""
+        return self.load_async(AVATAR_MODELS, callback)
+
+    def stats(self):
+        """Return cache hits, conversions and the last load time in milliseconds"""
+        return {
+            "bam_hits": self.bam_hits,
+            "conversions": self.conversions,
+            "load_ms": self.load_time * 1000
+        }
@@ -0,0 +1,134 @@
+import time
+from collections import deque
+
+from pose_compiler import PosePlan
+
+# Normal transition (lerp) time between poses, in seconds
+BASE_TRANSITION = 0.1
+
+
+class PlaybackScheduler:
+    """Keeps the avatar within a lag target of the speaker
+
+    Before each segment starts, the scheduler estimates the signing backlog
+    (this segment plus everything queued behind it) and picks a playback
+    speed. Faster playback shortens holds and transitions. Past a further
+    threshold, fingerspelled words collapse to their first few letters.
+    Segments that have waited longer than the hard limit are dropped.
+    Every decision is recorded and passed to on_decision.
+    """
+
+    def __init__(self, compiler, target_lag=2.0, hard_limit=6.0, max_speed=2.5,
+                 collapse_speed=1.5, spelled_letters=2, on_decision=None):
+        self.compiler = compiler
+        self.target_lag = target_lag
+        self.hard_limit = hard_limit
+        self.max_speed = max_speed
+        self.collapse_speed = collapse_speed
+        self.spelled_letters = spelled_letters
+        self.on_decision = on_decision
+
+        # Current playback state and decision log
+        self.speed = 1.0
+        self.decisions = deque(maxlen=50)
+        self.speedups = 0
+        self.collapses = 0
+        self.drops = 0
+
+    def report(self, text):
+        """Record a scheduling decision and pass it to the callback"""
+        self.decisions.append((time.monotonic(), text))
+        if self.on_decision:
+            self.on_decision(text)
+
+    def drop_stale(self, queue):
+        """Drop queued segments that have waited past the hard limit, and report overflow drops"""
+        for gloss, spoken_at in queue.take_overflowed():
+            self.drops += 1
+            self.report(f"Queue full: dropped oldest segment '{gloss}'")
+        for gloss, spoken_at in queue.drop_stale(self.hard_limit):
+            self.drops += 1
+            age = time.monotonic() - spoken_at
+            self.report(f"Dropped stale segment '{gloss}' ({age:.1f}s old)")
+
+    def backlog_seconds(self, plan, queued):
+        """Estimate signing time for plan plus every queued (gloss, spoken_at) segment"""
+        backlog = sum(plan.durations)
+        for gloss, _ in queued:
+            backlog += sum(self.compiler.compile(gloss).durations)
+        return backlog
+
+    def speed_for(self, backlog):
+        """Return the playback speed that brings a backlog (seconds) within the lag target"""
+        return min(self.max_speed, max(1.0, backlog / self.target_lag))
+
+    def adapt(self, plan, speed):
+        """Return the plan as played at speed, and how many letters collapsing skipped"""
+        removed = 0
+        if speed >= self.collapse_speed and any(plan.fingerspelled):
+            plan, removed = self.collapse_fingerspelling(plan)
+        if speed > 1.0:
+            plan = plan._replace(durations=tuple(d / speed for d in plan.durations))
+        return plan, removed
+
+    def preview(self, plan, queued):
+        """Return (plan, speed) as schedule() would play them now, without recording anything"""
+        speed = self.speed_for(self.backlog_seconds(plan, queued))
+        return self.adapt(plan, speed)[0], speed
+
+    def schedule(self, plan, queued):
+        """Return the plan adapted to the current backlog and set self.speed"""
+        backlog = self.backlog_seconds(plan, queued)
+        speed = self.speed_for(backlog)
+
+        if speed > 1.0:
+            self.speedups += 1
+            self.report(f"Backlog {backlog:.1f}s > target {self.target_lag:.1f}s: playing at {speed:.1f}x")
+        elif self.speed > 1.0:
+            self.report("Backlog cleared: back to normal speed")
+        self.speed = speed
+
+        plan, removed = self.adapt(plan, speed)
+        if removed:
+            self.collapses += 1
+            self.report(f"Collapsed fingerspelling: skipped {removed} letters")
+        return plan
+
+    def collapse_fingerspelling(self, plan):
+        """Keep only the first few letters of each fingerspelled word; returns (plan, letters skipped)
+
+        Letters are kept or dropped whole: a letter with several keyframes
+        (J, Z) is one run of consecutive pose ids under the same label.
+        """
+        keep = []
+        letters_in_word = {}
+        removed = 0
+        dropping = False
+        for step, word in enumerate(plan.words):
+            if plan.fingerspelled[step]:
+                new_letter = (step == 0 or plan.words[step - 1] != word
+                              or plan.labels[step - 1] != plan.labels[step]
+                              or plan.pose_ids[step] != plan.pose_ids[step - 1] + 1)
+                if new_letter:
+                    letters_in_word[word] = letters_in_word.get(word, 0) + 1
+                    dropping = letters_in_word[word] > self.spelled_letters
+                    removed += dropping
+                if dropping:
+                    continue
+            keep.append(step)
+
+        return PosePlan(*(tuple(field[step] for step in keep) for field in plan)), removed
+
+    def transition_time(self, speed=None):
+        """Return the lerp time between poses at speed (default: the current speed)"""
+        return BASE_TRANSITION / (speed or self.speed)
+
+    def stats(self):
+        """Return current speed and decision counters"""
+        return {
+            "speed": self.speed,
+            "speedups": self.speedups,
+            "collapses": self.collapses,
+            "drops": self.drops,
+            "last_decision": self.decisions[-1][1] if self.decisions else ""
+        }
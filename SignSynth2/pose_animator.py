@@ -1,80 +1,94 @@
-import json
-from direct.interval.LerpInterval import LerpPosInterval, LerpHprInterval
-from direct.interval.IntervalGlobal import Sequence
-from panda3d.core import LVecBase3f
+from clip_baker import ClipBaker
+from pose_blender import PoseBlender
+from pose_compiler import PoseCompiler
+from pose_library import PoseLibrary
+from transition_cache import TransitionCache
 
 class PoseAnimator:
-    def __init__(self, left_parts, right_parts):
-        self.left_parts = left_parts
-        self.right_parts = right_parts
-        self.gesture_data = self.loadAllPoseData()
+    def __init__(self, rig):
+        self.rig = rig
+        self.library = self.loadAllPoseData()
+        self.compiler = PoseCompiler(self.library)
         self.current_pose = "default"
         self.pose_index = 0
         self.pose_sequence = ["j"]
-        self.expanded_sequence = self.expandPoseSequence(self.pose_sequence)
+        self.plan = self.compilePlan(" ".join(self.pose_sequence))
+        self.expanded_sequence = list(self.plan.labels)
+
+        # Joint handles in the same order as the compiled pose array
+        self.joints = rig.joints
+
+        # Per-frame blend of all joints; driven by blender.task in the render loop.
+        # Transitions between library poses are memoized per (from, to, duration)
+        self.transitions = TransitionCache(self.library)
+        self.blender = PoseBlender(rig, transitions=self.transitions)
+
+        # Signs baked into native intervals, for playback without per-frame Python
+        self.clip_baker = ClipBaker(self.library, self.joints)
+        self.clip_queue = []
 
     def loadAllPoseData(self):
-        with open("sign_poses.json", "r") as f:
-            return json.load(f)
+        # Sharded library next to this module; only the index is read here,
+        # poses load on first use and are rebuilt when any sign file is newer
+        return PoseLibrary.load()
+
+    def compilePlan(self, gloss):
+        """Compile a gloss string into a cached PosePlan of pose ids and durations"""
+        return self.compiler.compile(gloss)
+
+    def prefetchGloss(self, gloss):
+        """Load the poses of an upcoming gloss into the library cache"""
+        return self.compiler.prefetch(gloss)
 
     def expandPoseSequence(self, sequence):
-        result = []
-        for word in sequence:
-            if word in self.gesture_data:
-                result.append(word)
-            else:
-                result.extend([c for c in word if c in self.gesture_data])
-        return result
+        """Return the sign names the sequence will play, fingerspelling unknown words"""
+        return list(self.compilePlan(" ".join(sequence)).labels)
+
+    def getPose(self, pose_id):
+        """Return the [joint, pos/hpr, xyz] array for an id from a compiled plan"""
+        return self.library.pose(pose_id)
 
     def loadPoseNow(self, pose_name):
-        poses = self.gesture_data.get(pose_name)
-        if not poses:
+        pose_id = self.library.first_pose_id(pose_name)
+        if pose_id is None:
             return None
+        return self.library.pose(pose_id)
+
+    def applyPoseInstantly(self, pose, pose_id=None):
+        self.blender.snap(pose, pose_id)
+
+    def applyDefaultPose(self):
+        """Snap to the resting pose, remembering its id so the next transition can be cached"""
+        pose_id = self.library.first_pose_id("default")
+        self.applyPoseInstantly(self.library.pose(pose_id), pose_id)
+
+    def animatePose(self, pose, time=0.05, pose_id=None, start=None):
+        # Arms and fingers blend together; joints the keyframe leaves unset hold still.
+        # start is the step's scheduled time, so a late start picks up mid-blend
+        self.blender.start(pose, time, now=start, target_id=pose_id)
+
+
+    def clipsForPlan(self, plan, speed=1.0, transition=0.1):
+        """Split a plan into (label, clip) pairs, one baked clip per sign or letter
+
+        Clips are baked at normal speed (durations are scaled back up by speed)
+        so every playback rate shares one clip; play them with playRate=speed.
+        """
+        clips = []
+        start = 0
+        for step in range(1, len(plan.pose_ids) + 1):
+            if (step < len(plan.pose_ids) and plan.words[step] == plan.words[start]
+                    and plan.labels[step] == plan.labels[start]
+                    and plan.pose_ids[step] == plan.pose_ids[step - 1] + 1):
+                continue
+            durations = [round(d * speed, 4) for d in plan.durations[start:step]]
+            clip = self.clip_baker.clip(plan.pose_ids[start:step], durations, transition)
+            clips.append((plan.labels[start], clip))
+            start = step
+        return clips
 
-        if isinstance(poses, list):
-            pose = poses[0]
-        else:
-            pose = poses
-
-        return pose
-
-    def applyPoseInstantly(self, pose):
-        l = pose["leftHand"]
-        r = pose["rightHand"]
-
-        self.left_parts["arm"].setPos(*l["pos"])
-        self.left_parts["arm"].setHpr(*l["hpr"])
-        self.right_parts["arm"].setPos(*r["pos"])
-        self.right_parts["arm"].setHpr(*r["hpr"])
-
-        self._applyFingersPose(l.get("fingers", {}), self.left_parts)
-        self._applyFingersPose(r.get("fingers", {}), self.right_parts)
-
-    def _applyFingersPose(self, fingers, parts):
-        for name, joints in fingers.items():
-            for part, pose_data in zip(parts[name], joints):
-                part.setPos(*pose_data["pos"])
-                part.setHpr(*pose_data["hpr"])
-
-    def animatePose(self, pose, time=0.05):
-        sequence = []
-        l = pose["leftHand"]
-        r = pose["rightHand"]
-
-        sequence += [
-            LerpPosInterval(self.left_parts["arm"], time, LVecBase3f(*l["pos"])),
-            LerpHprInterval(self.left_parts["arm"], time, LVecBase3f(*l["hpr"])),
-            LerpPosInterval(self.right_parts["arm"], time, LVecBase3f(*r["pos"])),
-            LerpHprInterval(self.right_parts["arm"], time, LVecBase3f(*r["hpr"])),
-        ]
-
-        def addFingerLerps(fingers, parts):
-            for name, joints in fingers.items():
-                for part, pose_data in zip(parts[name], joints):
-                    sequence.append(LerpPosInterval(part, 0, LVecBase3f(*pose_data["pos"])))
-                    sequence.append(LerpHprInterval(part, 0, LVecBase3f(*pose_data["hpr"])))
-
-        addFingerLerps(l.get("fingers", {}), self.left_parts)
-        addFingerLerps(r.get("fingers", {}), self.right_parts)
-
-        Sequence(*sequence).start()
+    def playClip(self, clip, speed=1.0):
+        """Start a baked clip; the interval manager steps it from here"""
+        self.blender.active = False
+        clip.start(playRate=speed)
+        return clip.getDuration() / speed
@@ -0,0 +1,162 @@
+import time
+
+import numpy as np
+from direct.task import Task
+
+from pose_library import HPR
+
+
+def linear(t):
+    """Constant speed"""
+    return t
+
+
+def smoothstep(t):
+    """Cubic ease in and out"""
+    return t * t * (3.0 - 2.0 * t)
+
+
+def ease_in_out(t):
+    """Cosine ease in and out"""
+    return 0.5 - 0.5 * np.cos(np.pi * t)
+
+
+EASINGS = {"linear": linear, "smoothstep": smoothstep, "ease_in_out": ease_in_out}
+
+
+class PoseBlender:
+    """Blends every joint of the rig toward a target pose once per frame
+
+    One render-loop task replaces the per-pose LerpInterval sequences: each
+    frame the whole [joint, pos/hpr, xyz] array is interpolated with NumPy and
+    written back in a single pass, so arms and fingers move together. Joints
+    a target leaves as NaN keep their current transform. Rotations take the
+    short way round. When the rig rests on a known library pose and the
+    target's id is given, the blend is read from a memoized TransitionCache
+    curve instead of being set up from scratch. Per-frame cost is tracked in
+    stats().
+    """
+
+    def __init__(self, rig, easing="smoothstep", transitions=None):
+        self.rig = rig
+        self.easing = EASINGS[easing]
+        self.transitions = transitions
+        if transitions is not None:
+            transitions.set_easing(self.easing)
+
+        # Current transforms, read back from the rig
+        self.sync()
+        self.source = self.current.copy()
+        self.delta = np.zeros_like(self.current)
+        self.start_time = 0.0
+        self.duration = 0.0
+
+        # Cached curve for the blend in progress, and the library pose the rig
+        # rests on (None when it's mid-blend or between poses)
+        self.curve = None
+        self.target_id = None
+        self.pose_id = None
+
+        # Per-frame cost bookkeeping, in seconds
+        self.frames = 0
+        self.total_cost = 0.0
+        self.max_cost = 0.0
+        self.last_cost = 0.0
+
+    def set_easing(self, name):
+        """Select the easing curve by name (see EASINGS)"""
+        self.easing = EASINGS[name]
+        if self.transitions is not None:
+            self.transitions.set_easing(self.easing)
+
+    def start(self, target, duration, now=None, target_id=None):
+        """Begin blending from the current transforms to target over duration seconds
+
+        target_id is the target's library pose id; passing it lets the blend
+        come from the transition cache.
+        """
+        if now is None:
+            now = time.monotonic()
+
+        from_id = None if self.active else self.pose_id
+        self.pose_id = None
+        self.target_id = target_id
+        self.curve = None
+
+        if (self.transitions is not None and target_id is not None
+                and self.transitions.cacheable(from_id)):
+            self.curve = self.transitions.curve(from_id, target_id, duration)
+        else:
+            self.source = self.current.copy()
+            target = np.where(np.isnan(target), self.source, target)
+            delta = target - self.source
+
+            # Shortest rotation: wrap heading/pitch/roll differences into [-180, 180)
+            delta[:, HPR] = (delta[:, HPR] + 180.0) % 360.0 - 180.0
+            self.delta = delta
+
+        self.start_time = now
+        self.duration = duration
+        self.active = True
+        if duration <= 0:
+            self.update(now)
+
+    def sync(self):
+        """Re-read the rig's transforms after something else has moved it"""
+        self.active = False
+        self.pose_id = None
+        self.current = self.rig.read()
+
+    def snap(self, pose, pose_id=None):
+        """Apply a pose immediately and stop any blend in progress"""
+        self.active = False
+        self.pose_id = pose_id
+        self.current = np.where(np.isnan(pose), self.current, pose).astype(np.float32)
+        self.write()
+
+    def update(self, now):
+        """Advance the blend to time now and write the joints; returns False when idle"""
+        if not self.active:
+            return False
+
+        started = time.perf_counter()
+        t = 1.0 if self.duration <= 0 else min(1.0, (now - self.start_time) / self.duration)
+        if self.curve is not None:
+            # Linear read between the curve's pre-eased samples
+            position = t * (len(self.curve) - 1)
+            index = min(int(position), len(self.curve) - 2)
+            fraction = np.float32(position - index)
+            self.current = self.curve[index] + (self.curve[index + 1] - self.curve[index]) * fraction
+        else:
+            self.current = self.source + self.delta * np.float32(self.easing(t))
+        self.write()
+        if t >= 1.0:
+            self.active = False
+            self.curve = None
+            self.pose_id = self.target_id
+
+        cost = time.perf_counter() - started
+        self.frames += 1
+        self.total_cost += cost
+        self.last_cost = cost
+        self.max_cost = max(self.max_cost, cost)
+        return True
+
+    def write(self):
+        """Write the current transforms to the rig in one pass"""
+        self.rig.apply(self.current)
+
+    def task(self, task):
+        """Render-loop task driving update() from the monotonic clock the timeline uses"""
+        self.update(time.monotonic())
+        return Task.cont
+
+    def stats(self):
+        """Return blended-frame count and per-frame cost in milliseconds"""
+        return {
+            "frames": self.frames,
+            "active": self.active,
+            "last_ms": self.last_cost * 1000,
+            "mean_ms": self.total_cost / self.frames * 1000 if self.frames else 0.0,
+            "max_ms": self.max_cost * 1000
+        }
@@ -0,0 +1,125 @@
+from collections import namedtuple
+
+from lru_cache import LRUCache
+
+# Default seconds per sign and letter, used when the library has no duration
+# metadata for it; keyframes of one sign share its duration
+SIGN_DURATION = 0.5
+LETTER_DURATION = 0.5
+
+# Ways to sign a gloss word, tried in the compiler's fallback order: the word's own
+# sign, the nearest sign from the library's substitute index, then fingerspelling
+FALLBACK_MODES = ("exact", "substitute", "fingerspell")
+
+# A compiled gloss: parallel tuples of pose ids, hold times, display labels, the
+# index of the gloss word each step came from, whether it was fingerspelled and the
+# seconds of fingerspelling a substitution avoided (on a substitute's first step)
+PosePlan = namedtuple("PosePlan", ["pose_ids", "durations", "labels", "words", "fingerspelled", "saved"])
+
+
+class PoseCompiler:
+    """Compiles gloss strings into flat pose-id plans using the library's sign index
+
+    Each word is signed by the first of `fallback` that works. Fingerspelling
+    is cut to the first spelled_letters letters when that is set.
+    """
+
+    def __init__(self, library, cache_size=256, fallback=FALLBACK_MODES, spelled_letters=None):
+        for mode in fallback:
+            if mode not in FALLBACK_MODES:
+                raise ValueError(f"Unknown fallback mode: {mode}")
+        self.library = library
+        self.fallback = tuple(fallback)
+        self.spelled_letters = spelled_letters
+        self.plans = LRUCache(cache_size)  # normalized gloss -> PosePlan
+
+    def compile(self, gloss):
+        """Return the cached PosePlan for a gloss string like "ME NOT WILL GO" """
+        key = " ".join(gloss.lower().split())
+        return self.plans.get_or_build(key, self.compile_uncached)
+
+    def prefetch(self, gloss):
+        """Compile a gloss and load its poses ahead of playback; returns the plan"""
+        plan = self.compile(gloss)
+        self.library.prefetch(plan.pose_ids)
+        return plan
+
+    def sign_steps(self, name, default_duration=SIGN_DURATION):
+        """Return the (pose id, duration, label) steps of a library sign; empty if it has none"""
+        ids = self.library.sign_pose_ids(name)
+        if not ids:
+            return []
+        step = (self.library.sign_duration(name) or default_duration) / len(ids)
+        return [(pose_id, step, name) for pose_id in ids]
+
+    def spell_steps(self, word):
+        """Return the steps fingerspelling a word: one per letter with a sign, abbreviated if set"""
+        steps = []
+        spelled = 0
+        for letter in word:
+            letter_steps = self.sign_steps(letter, LETTER_DURATION)
+            if not letter_steps:
+                continue
+            if self.spelled_letters is not None and spelled == self.spelled_letters:
+                break
+            steps.extend(letter_steps)
+            spelled += 1
+        return steps
+
+    def resolve(self, word, modes):
+        """Return (steps, fingerspelled, seconds saved) for a word from the first mode that works"""
+        for mode in modes:
+            if mode == "exact":
+                steps = self.sign_steps(word)
+                if steps:
+                    return steps, False, 0.0
+            elif mode == "substitute":
+                substitute = self.library.substitute(word)
+                steps = self.sign_steps(substitute[0]) if substitute else []
+                if steps:
+                    spelled = sum(duration for _, duration, _ in self.spell_steps(word))
+                    signed = sum(duration for _, duration, _ in steps)
+                    return steps, False, max(0.0, spelled - signed)
+            else:
+                steps = self.spell_steps(word)
+                if steps:
+                    return steps, True, 0.0
+        return [], False, 0.0
+
+    def compile_uncached(self, gloss):
+        """Turn a gloss string into a PosePlan, substituting or fingerspelling unknown words"""
+        pose_ids = []
+        durations = []
+        labels = []
+        words = []
+        fingerspelled = []
+        saved = []
+
+        whole_word_modes = [mode for mode in self.fallback if mode != "fingerspell"]
+        for word_index, token in enumerate(gloss.lower().split()):
+            # Whole sign (or its substitute) first, then each part of a compound like "thank-you"
+            resolved = self.resolve(token, whole_word_modes) if "-" in token else None
+            if resolved and resolved[0]:
+                resolutions = [resolved]
+            else:
+                resolutions = [self.resolve(part, self.fallback) for part in token.split("-")]
+
+            for steps, spelled, seconds_saved in resolutions:
+                for step, (pose_id, duration, label) in enumerate(steps):
+                    pose_ids.append(pose_id)
+                    durations.append(duration)
+                    labels.append(label)
+                    words.append(word_index)
+                    fingerspelled.append(spelled)
+                    saved.append(seconds_saved if step == 0 else 0.0)
+
+        return PosePlan(tuple(pose_ids), tuple(durations), tuple(labels), tuple(words),
+                        tuple(fingerspelled), tuple(saved))
+
+    def stats(self):
+        """Return library size and plan-cache counters"""
+        stats = self.plans.stats()
+        stats["signs"] = self.library.sign_count
+        stats["poses"] = self.library.pose_count
+        stats["fallback"] = self.fallback
+        return stats
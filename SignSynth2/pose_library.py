@@ -0,0 +1,457 @@
+import glob
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+from lru_cache import LRUCache
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: an open lock file already keeps its build directory from being renamed
+    fcntl = None
+
+MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_JSON_PATH = os.path.join(MODULE_DIR, "sign_poses.json")
+
+# Extra sign files; a large vocabulary can be split across many JSON files
+EXTRA_SIGNS_DIR = os.path.join(MODULE_DIR, "signs")
+
+# Per-sign playback durations in seconds; signs not listed use the compiler default
+DEFAULT_TIMING_PATH = os.path.join(MODULE_DIR, "sign_timing.json")
+
+# Synonym groups and word -> broader word (hypernym) links, compiled into an index
+# of the nearest available sign for words the library has no sign for
+DEFAULT_THESAURUS_PATH = os.path.join(MODULE_DIR, "sign_substitutes.json")
+
+# How a substitute relates to the word it stands in for, closest first
+SUBSTITUTE_KINDS = ("synonym", "hypernym")
+
+# Hypernym links followed when looking for a substitute (puppy -> dog -> animal)
+MAX_HYPERNYM_STEPS = 2
+
+# Compiled, sharded library (build output, rebuilt when any source is newer)
+DEFAULT_LIBRARY_DIR = os.path.join(MODULE_DIR, "sign_library")
+
+# Bump when the compiled layout changes so old builds are rebuilt
+LIBRARY_VERSION = 4
+
+# Superseded builds are removed once they are this many seconds old and no reader
+# holds them, so a concurrent build in progress is left alone too
+STALE_BUILD_AGE = 60
+
+# Lock file in each build; every open PoseLibrary holds a shared lock on its build's
+READER_LOCK = "reader.lock"
+
+# Poses per shard file
+SHARD_SIZE = 256
+
+# Finger names and joint counts, in the order the rig and compiled array use
+FINGERS = [("thumb", 2), ("index", 3), ("middle", 3), ("ring", 3), ("pinky", 3)]
+HANDS = ["leftHand", "rightHand"]
+
+# Flat joint layout: per hand the arm, then each finger joint in order
+JOINT_LAYOUT = [
+    (hand, part, segment)
+    for hand in HANDS
+    for part, segment in [("arm", 0)] + [(name, i) for name, count in FINGERS for i in range(count)]
+]
+JOINT_COUNT = len(JOINT_LAYOUT)
+
+# Second axis of each joint entry
+POS, HPR = 0, 1
+
+
+def default_sources():
+    """Return the pose JSON files that make up the sign library"""
+    return [DEFAULT_JSON_PATH] + sorted(glob.glob(os.path.join(EXTRA_SIGNS_DIR, "*.json")))
+
+
+def pose_to_array(pose):
+    """Flatten one pose dict into a [joint, pos/hpr, xyz] float32 array
+
+    Joints a keyframe doesn't specify (e.g. fingers during arm-only motion
+    frames) are stored as NaN and left untouched when the pose is applied.
+    """
+    array = np.full((JOINT_COUNT, 2, 3), np.nan, dtype=np.float32)
+    for joint, (hand, part, segment) in enumerate(JOINT_LAYOUT):
+        hand_data = pose[hand]
+        if part == "arm":
+            transform = hand_data
+        else:
+            joints = hand_data.get("fingers", {}).get(part, [])
+            if segment >= len(joints):
+                continue
+            transform = joints[segment]
+        array[joint, POS] = transform["pos"]
+        array[joint, HPR] = transform["hpr"]
+    return array
+
+
+def read_timing(path=DEFAULT_TIMING_PATH):
+    """Return {lowercase sign name: duration in seconds} from the timing file, if any"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r") as f:
+        return {name.lower(): float(duration) for name, duration in json.load(f)["durations"].items()}
+
+
+def read_thesaurus(path=DEFAULT_THESAURUS_PATH):
+    """Return ({word: synonyms}, {word: broader word}) from the thesaurus file, if any"""
+    if not os.path.exists(path):
+        return {}, {}
+    with open(path, "r") as f:
+        thesaurus = json.load(f)
+
+    synonyms = {}
+    for group in thesaurus.get("synonyms", []):
+        group = [word.lower() for word in group]
+        for word in group:
+            synonyms.setdefault(word, []).extend(other for other in group if other != word)
+    hypernyms = {word.lower(): broader.lower() for word, broader in thesaurus.get("hypernyms", {}).items()}
+    return synonyms, hypernyms
+
+
+def build_substitutes(synonyms, hypernyms, available):
+    """Map each thesaurus word without a sign to (nearest available sign, kind index)
+
+    A synonym is preferred; failing that, the broader word or one of its
+    synonyms, up to MAX_HYPERNYM_STEPS links up.
+    """
+    substitutes = {}
+    for word in set(synonyms) | set(hypernyms):
+        if word in available:
+            continue
+        level = [word] + synonyms.get(word, [])
+        for kind in [0] + [1] * MAX_HYPERNYM_STEPS:
+            match = next((other for other in level if other != word and other in available), None)
+            if match:
+                substitutes[word] = (match, kind)
+                break
+            broader = [hypernyms[other] for other in level if other in hypernyms]
+            level = [other for b in broader for other in [b] + synonyms.get(b, [])]
+            if not level:
+                break
+    return substitutes
+
+
+def library_inputs(sources, timing_path=DEFAULT_TIMING_PATH, thesaurus_path=DEFAULT_THESAURUS_PATH):
+    """Return {source path: [mtime in ns, size]} for every file a build reads"""
+    paths = list(sources) + [path for path in (timing_path, thesaurus_path) if os.path.exists(path)]
+    inputs = {}
+    for path in paths:
+        info = os.stat(path)
+        inputs[os.path.normcase(os.path.abspath(path))] = [info.st_mtime_ns, info.st_size]
+    return inputs
+
+
+def read_index(library_dir):
+    """Return a compiled library's index.json, or None if there is no build"""
+    try:
+        with open(os.path.join(library_dir, "index.json"), "r") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def build_in_use(build_dir):
+    """Return True if an open PoseLibrary holds a build's reader lock"""
+    if fcntl is None:
+        return False
+    try:
+        with open(os.path.join(build_dir, READER_LOCK), "a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return True
+    return False
+
+
+def remove_stale_builds(library_dir, current):
+    """Delete superseded builds no reader holds (and pre-build-directory leftovers)"""
+    now = time.time()
+    for name in os.listdir(library_dir):
+        path = os.path.join(library_dir, name)
+        try:
+            if name == current or now - os.path.getmtime(path) < STALE_BUILD_AGE:
+                continue
+            if name.startswith("build-") and os.path.isdir(path):
+                if build_in_use(path):
+                    continue
+                # Renamed out of the way first; on Windows this fails while a reader has it open
+                trash = path.replace("build-", "trash-", 1)
+                os.rename(path, trash)
+                shutil.rmtree(trash, ignore_errors=True)
+            elif name.startswith("trash-") and os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+            elif name.endswith((".npy", ".json.tmp")):
+                os.remove(path)
+        except OSError:
+            # Already removed by another builder, or still open by a reader (Windows)
+            continue
+
+
+def compile_pose_library(sources=None, library_dir=DEFAULT_LIBRARY_DIR, shard_size=SHARD_SIZE,
+                         timing_path=DEFAULT_TIMING_PATH, thesaurus_path=DEFAULT_THESAURUS_PATH):
+    """Compile pose JSON files into fixed-size .npy shards plus an index
+
+    Pose ids are global and contiguous, so pose id N lives in shard
+    N // shard_size at row N % shard_size. The sign index is a set of arrays,
+    sorted lowercase names with their (first pose id, keyframe count) and
+    duration (NaN for the default), so it can be memory-mapped and
+    binary-searched instead of parsed at startup. A sign's duration comes
+    from {"duration": s, "keyframes": [...]} in its pose file or from the
+    timing file, which takes precedence. Words in the thesaurus that have no
+    sign get a sorted substitute index pointing at their nearest sign's row.
+
+    Each build goes into its own build-* directory; index.json names the
+    current one and is replaced by a rename, so readers see either the old
+    build or the new one, and concurrent builders never touch each other's
+    files.
+    """
+    sources = sources or default_sources()
+    inputs = library_inputs(sources, timing_path, thesaurus_path)
+    os.makedirs(library_dir, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(prefix="build-", dir=library_dir)
+
+    signs = {}
+    durations = {}
+    shard = []
+    shard_count = 0
+    pose_count = 0
+
+    def flush():
+        nonlocal shard, shard_count
+        np.save(os.path.join(tmp_dir, f"shard_{shard_count:04d}.npy"), np.stack(shard))
+        shard = []
+        shard_count += 1
+
+    for path in sources:
+        with open(path, "r") as f:
+            gesture_data = json.load(f)
+        for name, keyframes in gesture_data.items():
+            if isinstance(keyframes, dict) and "keyframes" in keyframes:
+                if "duration" in keyframes:
+                    durations[name.lower()] = float(keyframes["duration"])
+                keyframes = keyframes["keyframes"]
+            if not isinstance(keyframes, list):
+                keyframes = [keyframes]
+            signs[name.lower()] = [pose_count, len(keyframes)]
+            for pose in keyframes:
+                shard.append(pose_to_array(pose))
+                pose_count += 1
+                if len(shard) == shard_size:
+                    flush()
+    if shard:
+        flush()
+
+    durations.update(read_timing(timing_path))
+
+    names = sorted(signs)
+    np.save(os.path.join(tmp_dir, "sign_names.npy"), np.array([name.encode("utf-8") for name in names]))
+    np.save(os.path.join(tmp_dir, "sign_ranges.npy"), np.array([signs[name] for name in names], dtype=np.int32))
+    np.save(os.path.join(tmp_dir, "sign_durations.npy"),
+            np.array([durations.get(name, np.nan) for name in names], dtype=np.float32))
+
+    rows = {name: row for row, name in enumerate(names)}
+    substitutes = build_substitutes(*read_thesaurus(thesaurus_path), rows)
+    words = sorted(substitutes)
+    np.save(os.path.join(tmp_dir, "substitute_names.npy"),
+            np.array([word.encode("utf-8") for word in words], dtype=bytes))
+    np.save(os.path.join(tmp_dir, "substitute_rows.npy"),
+            np.array([[rows[substitutes[word][0]], substitutes[word][1]] for word in words],
+                     dtype=np.int32).reshape(-1, 2))
+
+    # Written last and swapped in by rename: it switches readers to the finished build
+    fd, tmp_index = tempfile.mkstemp(suffix=".json.tmp", dir=library_dir)
+    with os.fdopen(fd, "w") as f:
+        json.dump({"version": LIBRARY_VERSION, "build": os.path.basename(tmp_dir), "inputs": inputs,
+                   "joints": ["/".join(map(str, j)) for j in JOINT_LAYOUT],
+                   "shard_size": shard_size, "pose_count": pose_count, "sign_count": len(names),
+                   "substitute_count": len(words)}, f)
+    os.replace(tmp_index, os.path.join(library_dir, "index.json"))
+
+    remove_stale_builds(library_dir, os.path.basename(tmp_dir))
+
+
+class PoseLibrary:
+    """Sharded sign library: index in memory, poses loaded on first use
+
+    Startup only maps the sorted sign index, so it costs the same for 30 signs
+    or 30,000; lookups binary-search it. Poses are copied out of memory-mapped
+    shards when first needed and kept in an LRU cache bounded by max_poses,
+    so memory stays flat however large the vocabulary grows. prefetch() loads
+    upcoming poses ahead of the render loop. All methods are thread-safe.
+    """
+
+    def __init__(self, library_dir, max_poses=512, max_open_shards=8):
+        index = read_index(library_dir)
+        if index is None:
+            raise FileNotFoundError(f"No compiled sign library in {library_dir}")
+
+        self.library_dir = library_dir
+        self.build_dir = build_dir = os.path.join(library_dir, index["build"])
+
+        # Held open for the library's lifetime so builders never delete this build under it
+        self.reader_lock = open(os.path.join(build_dir, READER_LOCK), "a")
+        if fcntl is not None:
+            fcntl.flock(self.reader_lock, fcntl.LOCK_SH)
+        self.shard_size = index["shard_size"]
+        self.pose_count = index["pose_count"]
+        self.sign_count = index["sign_count"]
+        self.substitute_count = index["substitute_count"]
+
+        # Sorted lowercase names, their [first pose id, keyframe count] rows and durations
+        self.sign_names = np.load(os.path.join(build_dir, "sign_names.npy"), mmap_mode="r")
+        self.sign_ranges = np.load(os.path.join(build_dir, "sign_ranges.npy"), mmap_mode="r")
+        self.sign_durations = np.load(os.path.join(build_dir, "sign_durations.npy"), mmap_mode="r")
+
+        # Sorted words without a sign and their [substitute sign row, SUBSTITUTE_KINDS index]
+        self.substitute_names = np.load(os.path.join(build_dir, "substitute_names.npy"), mmap_mode="r")
+        self.substitute_rows = np.load(os.path.join(build_dir, "substitute_rows.npy"), mmap_mode="r")
+
+        self.cache = LRUCache(max_poses)         # pose id -> [joint, pos/hpr, xyz] array
+        self.shards = LRUCache(max_open_shards)  # shard number -> memory-mapped array
+
+    @classmethod
+    def load(cls, sources=None, library_dir=DEFAULT_LIBRARY_DIR, timing_path=DEFAULT_TIMING_PATH,
+             thesaurus_path=DEFAULT_THESAURUS_PATH, **kwargs):
+        """Open the compiled library, rebuilding it first if its sources were changed, added or removed"""
+        sources = sources or default_sources()
+        index = read_index(library_dir)
+        if (index is None or index.get("version") != LIBRARY_VERSION
+                or index.get("inputs") != library_inputs(sources, timing_path, thesaurus_path)):
+            compile_pose_library(sources, library_dir, timing_path=timing_path, thesaurus_path=thesaurus_path)
+
+        return cls(library_dir, **kwargs)
+
+    def _row(self, name):
+        """Return the index row of a sign, or None"""
+        if not self.sign_count:
+            return None
+        key = name.lower().encode("utf-8")
+        row = int(np.searchsorted(self.sign_names, key))
+        if row == self.sign_count or self.sign_names[row] != key:
+            return None
+        return row
+
+    def _find(self, name):
+        """Return the (first pose id, keyframe count) of a sign, or None"""
+        row = self._row(name)
+        if row is None:
+            return None
+        first, count = self.sign_ranges[row].tolist()
+        return first, count
+
+    def sign_duration(self, name):
+        """Return a sign's duration metadata in seconds, or None for the default"""
+        row = self._row(name)
+        if row is None:
+            return None
+        duration = float(self.sign_durations[row])
+        return None if duration != duration else duration
+
+    def substitute(self, name):
+        """Return (sign name, "synonym" or "hypernym") for a word without a sign, or None"""
+        if not self.substitute_count:
+            return None
+        key = name.lower().encode("utf-8")
+        index = int(np.searchsorted(self.substitute_names, key))
+        if index == self.substitute_count or self.substitute_names[index] != key:
+            return None
+        row, kind = self.substitute_rows[index].tolist()
+        return self.sign_names[row].decode("utf-8"), SUBSTITUTE_KINDS[kind]
+
+    def has_sign(self, name):
+        """Return True if the library has a sign with this name"""
+        return self._find(name) is not None
+
+    def sign_pose_ids(self, name):
+        """Return the keyframe pose ids of a sign, or None if it isn't in the library"""
+        entry = self._find(name)
+        if entry is None:
+            return None
+        first, count = entry
+        return tuple(range(first, first + count))
+
+    def first_pose_id(self, name):
+        """Return the first keyframe id of a sign, or None if it isn't in the library"""
+        entry = self._find(name)
+        return entry[0] if entry else None
+
+    def _open_shard(self, number):
+        """Memory-map one shard file"""
+        return np.load(os.path.join(self.build_dir, f"shard_{number:04d}.npy"), mmap_mode="r")
+
+    def _load_pose(self, pose_id):
+        """Copy a pose out of its shard, keeping only a few shards open"""
+        shard = self.shards.get_or_build(pose_id // self.shard_size, self._open_shard)
+        pose = np.array(shard[pose_id % self.shard_size])
+        pose.flags.writeable = False
+        return pose
+
+    def pose(self, pose_id):
+        """Return the [joint, pos/hpr, xyz] array for a pose id, loading it if needed"""
+        return self.cache.get_or_build(pose_id, self._load_pose)
+
+    def prefetch(self, pose_ids):
+        """Load poses into the cache ahead of use"""
+        for pose_id in pose_ids:
+            self.pose(pose_id)
+
+    def stats(self):
+        """Return library size and cache counters"""
+        cache = self.cache.stats()
+        return {
+            "signs": self.sign_count,
+            "poses": self.pose_count,
+            "substitutes": self.substitute_count,
+            "cached_poses": cache["size"],
+            "open_shards": len(self.shards),
+            "hits": cache["hits"],
+            "misses": cache["misses"],
+            "evictions": cache["evictions"],
+            "hit_rate": cache["hit_rate"]
+        }
+
+
+def benchmark(sign_counts=(28, 1000, 5000, 20000), keyframes=2):
+    """Print startup time and memory for synthetic libraries of growing size"""
+    import tempfile
+    import time
+    import tracemalloc
+
+    with open(DEFAULT_JSON_PATH, "r") as f:
+        template = json.load(f)["default"]
+
+    for count in sign_counts:
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, "signs.json")
+            with open(source, "w") as f:
+                json.dump({f"sign{i}": [template] * keyframes for i in range(count)}, f)
+            library_dir = os.path.join(tmp, "library")
+            compile_pose_library([source], library_dir)
+
+            tracemalloc.start()
+            start = time.perf_counter()
+            library = PoseLibrary(library_dir)
+            for i in range(0, count, max(1, count // 50)):
+                library.prefetch(library.sign_pose_ids(f"sign{i}"))
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            print(f"{count:>6} signs: open + 50 signs in {elapsed * 1000:.1f} ms, "
+                  f"peak {peak / 1024:.0f} KiB, {library.stats()['open_shards']} shards open")
+
+
+# Rebuild the compiled library by hand, then show how it scales
+if __name__ == "__main__":
+    compile_pose_library()
+    library = PoseLibrary.load()
+    print(f"Compiled {library.sign_count} signs / {library.pose_count} poses x {JOINT_COUNT} joints "
+          f"into {DEFAULT_LIBRARY_DIR}")
+    benchmark()
@@ -0,0 +1,131 @@
+import time
+from collections import deque, namedtuple
+
+from direct.task import Task
+from panda3d.core import AntialiasAttrib
+
+# One rendering quality level. Antialiasing only has an effect when the viewport has a
+# multisample framebuffer (requested by ScaledViewport; the software renderer has none).
+# resolution_scale is the fraction of the viewport's pixels the avatar is rendered at
+QualityTier = namedtuple("QualityTier", ["name", "shadows", "auto_shader", "antialias", "resolution_scale"])
+
+# Lowest to highest
+QUALITY_TIERS = [
+    QualityTier("minimal", False, False, False, 0.5),
+    QualityTier("low", False, True, False, 0.75),
+    QualityTier("medium", False, True, True, 1.0),
+    QualityTier("high", True, True, True, 1.0),
+]
+
+# Frame-time histogram bucket upper edges, in milliseconds (last bucket is open-ended)
+HISTOGRAM_EDGES_MS = [8, 16, 33, 50]
+
+
+class QualityGovernor:
+    """Steps rendering quality down when frames run over budget and back up with headroom
+
+    Frame time is the work done between the first task of a frame and the
+    end of rendering, so the render governor's idle frame limiting doesn't
+    count against it. Every `window` frames the recent mean is compared to
+    budget_ms: over budget steps one tier down, under headroom * budget
+    steps one tier up. After a change the governor waits `cooldown` seconds
+    before judging again, so a single spike can't make it oscillate.
+    """
+
+    def __init__(self, base, root, light, viewport=None, budget_ms=33.0, headroom=0.5,
+                 window=60, cooldown=2.0, tier=len(QUALITY_TIERS) - 1, on_change=None):
+        self.base = base
+        self.root = root
+        self.light = light
+        self.viewport = viewport
+        self.budget_ms = budget_ms
+        self.headroom = headroom
+        self.window = window
+        self.cooldown = cooldown
+        self.on_change = on_change
+
+        self.tier = tier
+        self.frame_start = None
+        self.recent = deque(maxlen=window)
+        self.history = deque(maxlen=window * 5)
+        self.changed_at = 0.0
+        self.changes = 0
+        self.apply(tier)
+
+        # First task of the frame, and one after igLoop has rendered it
+        base.taskMgr.add(self.start_frame, "QualityFrameStartTask", sort=-100)
+        base.taskMgr.add(self.end_frame, "QualityFrameEndTask", sort=60)
+
+    def apply(self, tier):
+        """Switch every quality setting to a tier"""
+        self.tier = tier
+        settings = QUALITY_TIERS[tier]
+
+        self.light.node().setShadowCaster(settings.shadows)
+        if settings.auto_shader:
+            self.root.setShaderAuto()
+        else:
+            self.root.setShaderOff()
+        self.root.setAntialias(AntialiasAttrib.MMultisample if settings.antialias else AntialiasAttrib.MNone)
+        if self.viewport is not None:
+            self.viewport.set_scale(settings.resolution_scale)
+
+        self.changed_at = time.monotonic()
+        self.recent.clear()
+
+    def step(self, direction):
+        """Move one tier up (+1) or down (-1) if possible"""
+        tier = min(len(QUALITY_TIERS) - 1, max(0, self.tier + direction))
+        if tier == self.tier:
+            return
+        self.apply(tier)
+        self.changes += 1
+        if self.on_change:
+            self.on_change(QUALITY_TIERS[tier])
+
+    def start_frame(self, task):
+        self.frame_start = time.perf_counter()
+        return Task.cont
+
+    def end_frame(self, task):
+        """Record this frame's work time and re-evaluate once per window"""
+        if self.frame_start is None:
+            return Task.cont
+        frame_ms = (time.perf_counter() - self.frame_start) * 1000
+        self.recent.append(frame_ms)
+        self.history.append(frame_ms)
+
+        if len(self.recent) == self.window and time.monotonic() - self.changed_at > self.cooldown:
+            mean_ms = sum(self.recent) / len(self.recent)
+            if mean_ms > self.budget_ms:
+                self.step(-1)
+            elif mean_ms < self.budget_ms * self.headroom:
+                self.step(1)
+            self.recent.clear()
+        return Task.cont
+
+    def histogram(self):
+        """Return frame counts per HISTOGRAM_EDGES_MS bucket over recent frames"""
+        counts = [0] * (len(HISTOGRAM_EDGES_MS) + 1)
+        for frame_ms in self.history:
+            bucket = 0
+            while bucket < len(HISTOGRAM_EDGES_MS) and frame_ms >= HISTOGRAM_EDGES_MS[bucket]:
+                bucket += 1
+            counts[bucket] += 1
+        return counts
+
+    def summary(self):
+        """Return a two-line tier and frame-time histogram description for the UI"""
+        labels = [f"<{edge}" for edge in HISTOGRAM_EDGES_MS] + [f"{HISTOGRAM_EDGES_MS[-1]}+"]
+        buckets = " ".join(f"{label}:{count}" for label, count in zip(labels, self.histogram()))
+        settings = QUALITY_TIERS[self.tier]
+        return f"Quality: {settings.name} ({settings.resolution_scale:.0%} res)\nFrame ms {buckets}"
+
+    def stats(self):
+        """Return the current tier, change count and mean recent frame time"""
+        return {
+            "tier": QUALITY_TIERS[self.tier].name,
+            "changes": self.changes,
+            "mean_ms": sum(self.history) / len(self.history) if self.history else 0.0,
+            "histogram": self.histogram()
+        }
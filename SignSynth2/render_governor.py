@@ -0,0 +1,112 @@
+import threading
+import time
+
+from direct.task import Task
+
+
+class RenderGovernor:
+    """Drops the frame rate while nothing on screen is changing
+
+    The governor's task runs every frame. While is_busy() reports animation,
+    or for idle_after seconds after the last wake(), frames are limited to
+    active_fps; otherwise to idle_fps. The limiting sleep happens in a task
+    after rendering rather than in the clock, so frame-time measurements
+    exclude it, and wake() - cheap and thread-safe, e.g. from the speech
+    thread on new text - cuts an idle sleep short. Mouse movement and key
+    presses wake it too. Process CPU time is tallied per mode for stats().
+    """
+
+    def __init__(self, base, is_busy=None, active_fps=60, idle_fps=10, idle_after=0.5):
+        self.base = base
+        self.is_busy = is_busy or (lambda: False)
+        self.active_fps = active_fps
+        self.idle_fps = idle_fps
+        self.idle_after = idle_after
+
+        self.idle = False
+        self.last_activity = time.monotonic()
+        self.last_mouse = None
+
+        # Set by wake() to end an idle sleep early
+        self.wake_event = threading.Event()
+        self.frame_end = time.perf_counter()
+
+        # CPU and wall time spent in each mode, in seconds
+        self.mode_started = time.monotonic()
+        self.mode_cpu_started = time.process_time()
+        self.cpu = {"active": 0.0, "idle": 0.0}
+        self.wall = {"active": 0.0, "idle": 0.0}
+
+        # Key presses anywhere in the window count as activity
+        thrower = base.buttonThrowers[0].node() if base.buttonThrowers else None
+        if thrower is not None and not thrower.getButtonDownEvent():
+            thrower.setButtonDownEvent("governor-button-down")
+            base.accept("governor-button-down", lambda button: self.wake())
+
+        base.taskMgr.add(self.task, "RenderGovernorTask", sort=-50)
+        base.taskMgr.add(self.limit, "RenderGovernorLimitTask", sort=100)
+
+    def wake(self):
+        """Note activity; rendering goes back to full rate right away"""
+        self.last_activity = time.monotonic()
+        if self.idle:
+            self.wake_event.set()
+
+    def mouse_moved(self):
+        """Return True if the pointer moved since the last frame"""
+        watcher = self.base.mouseWatcherNode
+        if watcher is None or not watcher.hasMouse():
+            return False
+        mouse = (watcher.getMouseX(), watcher.getMouseY())
+        moved = mouse != self.last_mouse
+        self.last_mouse = mouse
+        return moved
+
+    def switch(self, idle):
+        """Change mode, booking the CPU and wall time spent in the old one"""
+        now = time.monotonic()
+        cpu_now = time.process_time()
+        mode = "idle" if self.idle else "active"
+        self.wall[mode] += now - self.mode_started
+        self.cpu[mode] += cpu_now - self.mode_cpu_started
+        self.mode_started = now
+        self.mode_cpu_started = cpu_now
+
+        self.idle = idle
+
+    def task(self, task):
+        """Per-frame check: full rate while busy or recently woken, idle rate otherwise"""
+        if self.mouse_moved() or self.is_busy():
+            self.wake()
+        idle = time.monotonic() - self.last_activity > self.idle_after
+        if idle != self.idle:
+            self.switch(idle)
+        return Task.cont
+
+    def limit(self, task):
+        """Last task of the frame: sleep off the rest of the frame period"""
+        period = 1.0 / (self.idle_fps if self.idle else self.active_fps)
+        remaining = self.frame_end + period - time.perf_counter()
+        if remaining > 0:
+            self.wake_event.wait(remaining)
+        self.wake_event.clear()
+        self.frame_end = time.perf_counter()
+        return Task.cont
+
+    def stats(self):
+        """Return the current mode and CPU use (percent of one core) per mode"""
+        now = time.monotonic()
+        cpu_now = time.process_time()
+        wall = dict(self.wall)
+        cpu = dict(self.cpu)
+        mode = "idle" if self.idle else "active"
+        wall[mode] += now - self.mode_started
+        cpu[mode] += cpu_now - self.mode_cpu_started
+        return {
+            "mode": mode,
+            "fps": self.idle_fps if self.idle else self.active_fps,
+            "active_cpu_pct": cpu["active"] / wall["active"] * 100 if wall["active"] else 0.0,
+            "idle_cpu_pct": cpu["idle"] / wall["idle"] * 100 if wall["idle"] else 0.0,
+            "active_seconds": wall["active"],
+            "idle_seconds": wall["idle"]
+        }
@@ -0,0 +1,119 @@
+from direct.showbase.DirectObject import DirectObject
+from panda3d.core import (Camera, CardMaker, FrameBufferProperties, NodePath, OrthographicLens,
+                          SamplerState, Texture, TextureStage)
+
+
+class ScaledViewport(DirectObject):
+    """A window region that shows a scene rendered at a fraction of its pixel size
+
+    The camera draws into an offscreen texture buffer sized at
+    scale x the region's pixels; the region itself only draws one textured
+    card, stretched over it. With the software renderer, cost follows pixel
+    count, so a scale of 0.5 draws a quarter of the pixels. set_scale()
+    rebuilds the buffer; the window resizing does too. Where the GSG needs
+    power-of-two textures the buffer is padded up to one and the scene drawn
+    into its lower-left corner, which is all the card shows.
+    """
+
+    def __init__(self, base, camera, dimensions, scale=1.0, clear_color=(0.9, 0.9, 0.9, 1),
+                 multisamples=4):
+        DirectObject.__init__(self)
+        self.base = base
+        self.camera = camera
+        self.clear_color = clear_color
+        self.multisamples = multisamples
+        self.scale = scale
+        self.active = True
+        self.buffer = None
+        self.size = (0, 0)
+
+        self.texture = Texture("scaled_viewport")
+        self.texture.setMagfilter(SamplerState.FT_linear)
+        self.texture.setMinfilter(SamplerState.FT_linear)
+
+        # The window region draws a single full-region card showing the texture
+        self.card_root = NodePath("scaled_viewport_card")
+        self.card_root.setDepthTest(False)
+        self.card_root.setDepthWrite(False)
+        card_maker = CardMaker("scaled_viewport_card")
+        card_maker.setFrameFullscreenQuad()
+        self.card = self.card_root.attachNewNode(card_maker.generate())
+        self.card.setTexture(self.texture)
+
+        lens = OrthographicLens()
+        lens.setFilmSize(2, 2)
+        lens.setNearFar(-10, 10)
+        self.card_camera = self.card_root.attachNewNode(Camera("scaled_viewport_card_camera", lens))
+
+        self.region = base.win.makeDisplayRegion(*dimensions)
+        self.region.setCamera(self.card_camera)
+
+        self.rebuild()
+        self.accept("window-event", self.window_changed)
+
+    def buffer_size(self):
+        """Return the buffer size for the current scale and region size"""
+        width = max(1, int(round(self.region.getPixelWidth() * self.scale)))
+        height = max(1, int(round(self.region.getPixelHeight() * self.scale)))
+        return width, height
+
+    def texture_size(self, width, height):
+        """Return the buffer size to allocate for width x height, padded if the GSG needs it"""
+        if self.base.win.getGsg().getSupportsTexNonPow2():
+            return width, height
+        return Texture.upToPower2(width), Texture.upToPower2(height)
+
+    def make_buffer(self, width, height):
+        """Open the offscreen buffer, with multisampling when the pipe can provide it"""
+        for multisamples in (self.multisamples, 0):
+            props = FrameBufferProperties()
+            props.setRgbColor(True)
+            props.setDepthBits(1)
+            props.setMultisamples(multisamples)
+            buffer = self.base.win.makeTextureBuffer("scaled_viewport", width, height, self.texture, fbp=props)
+            if buffer is not None:
+                return buffer
+        return None
+
+    def rebuild(self):
+        """Recreate the offscreen buffer at the current scale"""
+        size = self.buffer_size()
+        if self.buffer is not None and size == self.size:
+            return
+        if self.buffer is not None:
+            self.base.graphicsEngine.removeWindow(self.buffer)
+
+        self.size = size
+        width, height = size
+        buffer_width, buffer_height = self.texture_size(width, height)
+        self.buffer = self.make_buffer(buffer_width, buffer_height)
+        if self.buffer is None:
+            print("Error creating the avatar viewport buffer")
+            return
+        self.buffer.setClearColor(self.clear_color)
+        self.buffer.setActive(self.active)
+
+        # Draw into, and show, only the width x height corner of a padded buffer
+        used_x = width / buffer_width
+        used_y = height / buffer_height
+        region = self.buffer.makeDisplayRegion(0, used_x, 0, used_y)
+        region.setCamera(self.camera)
+        self.card.setTexScale(TextureStage.getDefault(), used_x, used_y)
+        self.camera.node().getLens().setAspectRatio(width / height)
+
+    def set_scale(self, scale):
+        """Render at scale x the region's pixels"""
+        self.scale = scale
+        self.rebuild()
+
+    def set_active(self, active):
+        """Start or stop drawing the region and rendering its buffer"""
+        self.active = active
+        self.region.setActive(active)
+        if self.buffer is not None:
+            self.buffer.setActive(active)
+
+    def window_changed(self, window):
+        """Keep the buffer matched to the region after a resize"""
+        if window == self.base.win:
+            self.rebuild()
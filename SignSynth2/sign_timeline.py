@@ -0,0 +1,68 @@
+class SignTimeline:
+    """Schedules the steps of a PosePlan against a monotonic clock
+
+    load() pins each step to an absolute start time, so step N always
+    begins at start + the durations before it, whatever the frame rate. Each
+    frame, advance(now) reports the step that should be showing. A late
+    frame skips straight to the current step (and the blend is started from
+    its scheduled time), so lateness never accumulates into the rest of the
+    sign. Drift - how late each step actually started - and skipped steps
+    are tallied across plans for stats().
+    """
+
+    def __init__(self):
+        self.plan = None
+        self.starts = []
+        self.end = 0.0
+        self.step = -1
+
+        # Session counters; drift in seconds
+        self.steps_started = 0
+        self.skipped = 0
+        self.total_drift = 0.0
+        self.max_drift = 0.0
+        self.last_drift = 0.0
+
+    def load(self, plan, start):
+        """Schedule a plan's steps from start (a time.monotonic() value)"""
+        self.plan = plan
+        self.starts = []
+        at = start
+        for duration in plan.durations:
+            self.starts.append(at)
+            at += duration
+        self.end = at
+        self.step = -1
+
+    def advance(self, now):
+        """Return the index of the step due at now if it changed since the last call, else None"""
+        step = self.step
+        while step + 1 < len(self.starts) and self.starts[step + 1] <= now:
+            step += 1
+        if step == self.step:
+            return None
+
+        # Steps whose whole slot passed between two frames are never shown
+        self.skipped += step - self.step - 1
+        self.step = step
+
+        drift = now - self.starts[step]
+        self.steps_started += 1
+        self.total_drift += drift
+        self.last_drift = drift
+        self.max_drift = max(self.max_drift, drift)
+        return step
+
+    def finished(self, now):
+        """Return True once the last step's slot has ended"""
+        return now >= self.end
+
+    def stats(self):
+        """Return steps started, steps skipped and start drift in milliseconds"""
+        return {
+            "steps": self.steps_started,
+            "skipped": self.skipped,
+            "last_drift_ms": self.last_drift * 1000,
+            "mean_drift_ms": self.total_drift / self.steps_started * 1000 if self.steps_started else 0.0,
+            "max_drift_ms": self.max_drift * 1000
+        }
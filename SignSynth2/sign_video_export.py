@@ -0,0 +1,180 @@
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+import numpy as np
+
+# Shared modules live in the repository root
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from gloss_batch import READERS, default_tokenizer, read_records
+from gloss_engine import get_engine
+from gloss_tokenizer import TOKENIZER_MODES
+from model_cache import AVATAR_MODELS, prepare_bam_cache
+from pose_library import PoseLibrary
+
+OUTPUT_FORMATS = ("y4m", "ppm", "png")
+
+# Per-worker renderer, created by _init_worker (one ShowBase per process)
+_renderer = None
+
+
+def rgb_to_ycbcr(frame):
+    """Convert an RGB uint8 frame to full-range BT.601 Y, Cb, Cr planes"""
+    rgb = frame.astype(np.float32)
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    y = 0.299 * r + 0.587 * g + 0.114 * b
+    cb = 128.0 - 0.168736 * r - 0.331264 * g + 0.5 * b
+    cr = 128.0 + 0.5 * r - 0.418688 * g - 0.081312 * b
+    return [np.clip(plane + 0.5, 0, 255).astype(np.uint8) for plane in (y, cb, cr)]
+
+
+def write_y4m(path, frames, width, height, fps):
+    """Write frames as uncompressed 4:4:4 YUV4MPEG2 video; returns the frame count"""
+    count = 0
+    with open(path, "wb") as f:
+        f.write(f"YUV4MPEG2 W{width} H{height} F{fps}:1 Ip A1:1 C444 XCOLORRANGE=FULL\n".encode())
+        for frame in frames:
+            f.write(b"FRAME\n")
+            for plane in rgb_to_ycbcr(frame):
+                f.write(plane.tobytes())
+            count += 1
+    return count
+
+
+def write_ppm_sequence(directory, frames):
+    """Write frames as numbered binary PPM images; returns the frame count"""
+    os.makedirs(directory, exist_ok=True)
+    count = 0
+    for count, frame in enumerate(frames, 1):
+        height, width = frame.shape[:2]
+        with open(os.path.join(directory, f"frame_{count:05d}.ppm"), "wb") as f:
+            f.write(f"P6 {width} {height} 255\n".encode())
+            f.write(frame.tobytes())
+    return count
+
+
+def write_png_sequence(directory, frames):
+    """Write frames as numbered PNG images through Panda3D's image writers; returns the frame count"""
+    from panda3d.core import Filename, Texture
+
+    os.makedirs(directory, exist_ok=True)
+    count = 0
+    texture = Texture("export_frame")
+    for count, frame in enumerate(frames, 1):
+        height, width = frame.shape[:2]
+        texture.setup2dTexture(width, height, Texture.T_unsigned_byte, Texture.F_rgb)
+        texture.setRamImageAs(frame[::-1].tobytes(), "RGB")
+        texture.write(Filename.fromOsSpecific(os.path.join(directory, f"frame_{count:05d}.png")))
+    return count
+
+
+def _init_worker(width, height, fps):
+    """Worker: open this process's headless renderer once"""
+    global _renderer
+    from headless_renderer import HeadlessRenderer
+    _renderer = HeadlessRenderer(width, height, fps)
+
+
+def _render_item(args):
+    """Worker: render one gloss and write it out; returns (index, frames, output seconds)"""
+    index, gloss, output_dir, output_format = args
+    plan = _renderer.animator.compilePlan(gloss)
+    if not plan.pose_ids:
+        return index, None, 0, 0.0
+
+    frames = _renderer.frames(gloss)
+    name = f"{index:05d}"
+    if output_format == "y4m":
+        path = os.path.join(output_dir, name + ".y4m")
+        count = write_y4m(path, frames, _renderer.width, _renderer.height, _renderer.fps)
+    elif output_format == "ppm":
+        path = os.path.join(output_dir, name)
+        count = write_ppm_sequence(path, frames)
+    else:
+        path = os.path.join(output_dir, name)
+        count = write_png_sequence(path, frames)
+    return index, path, count, count / _renderer.fps
+
+
+def export_batch(items, output_dir, output_format="y4m", workers=None, width=640, height=480, fps=30):
+    """Render (index, gloss) items across worker processes, yielding results as they finish
+
+    Each result is (index, output path or None if nothing was signable,
+    frame count, seconds of output).
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format: {output_format}")
+
+    os.makedirs(output_dir, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+
+    # Build the sign library and .bam copies here, once, so workers only read finished caches
+    PoseLibrary.load()
+    prepare_bam_cache(AVATAR_MODELS)
+    tasks = [(index, gloss, output_dir, output_format) for index, gloss in items]
+
+    with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(width, height, fps)) as pool:
+        yield from pool.imap_unordered(_render_item, tasks)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render sign-language clips for text, SRT or JSONL files")
+    parser.add_argument("input", help="input file, or - for stdin")
+    parser.add_argument("-o", "--output", default="sign_videos", help="output directory")
+    parser.add_argument("-f", "--format", choices=["text", "srt", "jsonl"],
+                        help="input format (default: from the file extension)")
+    parser.add_argument("--field", default="text", help="JSONL field holding the sentence")
+    parser.add_argument("--gloss", action="store_true", help="input lines are already gloss")
+    parser.add_argument("-t", "--tokenizer", choices=TOKENIZER_MODES,
+                        help="default: nltk for text and SRT input when available, otherwise fast")
+    parser.add_argument("-e", "--encoding", choices=OUTPUT_FORMATS, default="y4m",
+                        help="uncompressed y4m video, or a ppm/png image sequence per item")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="render processes (default: CPU count)")
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--height", type=int, default=480)
+    parser.add_argument("--fps", type=int, default=30)
+    args = parser.parse_args(argv)
+
+    input_format = args.format or READERS.get(os.path.splitext(args.input)[1].lower(), "text")
+    tokenizer = args.tokenizer or default_tokenizer(input_format)
+    infile = sys.stdin if args.input == "-" else open(args.input, "r", encoding="utf-8-sig")
+    try:
+        records = list(read_records(infile, input_format, args.field))
+    finally:
+        if infile is not sys.stdin:
+            infile.close()
+
+    # Gloss conversion is cheap next to rendering, so it stays in this process
+    engine = get_engine()
+    for record in records:
+        record["gloss"] = record["text"] if args.gloss else engine.convert(record["text"], tokenizer)[0]
+
+    start = time.perf_counter()
+    items = [(index, record["gloss"]) for index, record in enumerate(records)]
+    output_seconds = 0.0
+    for index, path, frames, seconds in export_batch(items, args.output, args.encoding, args.workers,
+                                                     args.width, args.height, args.fps):
+        records[index].update({"output": path, "frames": frames, "seconds": seconds})
+        output_seconds += seconds
+
+    # Manifest of every item, in input order
+    with open(os.path.join(args.output, "manifest.jsonl"), "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    elapsed = time.perf_counter() - start
+    rate = output_seconds / elapsed if elapsed else 0.0
+    print(f"Rendered {len(records)} items ({output_seconds:.1f}s of output) in {elapsed:.2f}s "
+          f"({rate:.1f} output-seconds per second)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
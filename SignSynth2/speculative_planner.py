@@ -0,0 +1,131 @@
+import threading
+import time
+
+
+class SpeculativePlanner:
+    """Prepares signs from partial recognition results before the final arrives
+
+    speculate() takes the gloss of the stable start of a partial hypothesis,
+    compiles it, loads its poses and builds the transition curves between
+    them, all on the speech thread. When the final result comes in, confirm()
+    scores the prediction sign by sign and prepares the final gloss, which by
+    then is mostly cache hits. A misprediction costs nothing to undo: the
+    prediction is simply replaced and its cached entries age out of the LRUs.
+
+    Curves are warmed under the keys playback will ask for: the plan is put
+    through the scheduler's preview for the current backlog, so durations
+    and transition times match the speed it will play at, and the first
+    transition starts from the pose the avatar will be on - the end of the
+    last confirmed segment while anything is playing or queued, otherwise
+    its current pose. The transition cache counts render-loop lookups that
+    hit a warmed curve; that's what stats() reports as misses avoided.
+    """
+
+    def __init__(self, animator, scheduler, is_busy=None):
+        self.animator = animator
+        self.scheduler = scheduler
+        self.is_busy = is_busy or (lambda: False)
+        self.lock = threading.Lock()
+
+        # The current prediction (gloss tokens), and the last pose of the last confirmed plan
+        self.predicted = None
+        self.last_pose_id = None
+
+        # Counters; times in seconds
+        self.speculations = 0
+        self.hits = 0
+        self.misses = 0
+        self.unpredicted = 0
+        self.predicted_signs = 0
+        self.confirmed_signs = 0
+        self.ready_time = 0.0
+        self.finals = 0
+
+    def start_pose(self, queued):
+        """Return the pose id the avatar will rest on when the next segment starts"""
+        if (queued or self.is_busy()) and self.last_pose_id is not None:
+            return self.last_pose_id
+        blender = self.animator.blender
+        return blender.target_id if blender.active else blender.pose_id
+
+    def prepare(self, gloss, queued, warmed_by):
+        """Compile a gloss, load its poses and warm its transition curves; returns the scheduled plan
+
+        queued is the (gloss, spoken_at) backlog ahead of this segment.
+        """
+        plan = self.animator.prefetchGloss(gloss)
+        plan, speed = self.scheduler.preview(plan, queued)
+        transitions = self.animator.transitions
+        transition = self.scheduler.transition_time(speed)
+
+        # Same (from, to, duration) keys the blender will ask for
+        from_id = self.start_pose(queued)
+        for pose_id, duration in zip(plan.pose_ids, plan.durations):
+            if transitions.cacheable(from_id):
+                transitions.curve(from_id, pose_id, min(transition, duration), warmed_by=warmed_by)
+            from_id = pose_id
+        return plan
+
+    def speculate(self, gloss, queued):
+        """Prepare the gloss of a partial hypothesis's stable prefix"""
+        tokens = gloss.split()
+        with self.lock:
+            if not tokens or tokens == self.predicted:
+                return
+
+        self.prepare(gloss, queued, "speculate")
+
+        with self.lock:
+            self.predicted = tokens
+            self.speculations += 1
+
+    def confirm(self, gloss, queued):
+        """Score the prediction against a final gloss and prepare it; returns the plan"""
+        tokens = gloss.split()
+        with self.lock:
+            predicted = self.predicted
+            self.predicted = None
+
+            if not predicted:
+                self.unpredicted += 1
+            else:
+                # Signs predicted in the right place are confirmed; the rest were wasted work
+                confirmed = 0
+                for guess, actual in zip(predicted, tokens):
+                    if guess != actual:
+                        break
+                    confirmed += 1
+                if confirmed == len(predicted):
+                    self.hits += 1
+                else:
+                    self.misses += 1
+                self.predicted_signs += len(predicted)
+                self.confirmed_signs += confirmed
+
+        started = time.perf_counter()
+        plan = self.prepare(gloss, queued, "confirm")
+        elapsed = time.perf_counter() - started
+
+        with self.lock:
+            if plan.pose_ids:
+                self.last_pose_id = plan.pose_ids[-1]
+            self.ready_time += elapsed
+            self.finals += 1
+        return plan
+
+    def stats(self):
+        """Return prediction hit rates, render-loop curve builds avoided and final preparation ms"""
+        avoided = self.animator.transitions.stats()["avoided"]
+        with self.lock:
+            scored = self.hits + self.misses
+            return {
+                "speculations": self.speculations,
+                "hits": self.hits,
+                "misses": self.misses,
+                "unpredicted": self.unpredicted,
+                "hit_rate": self.hits / scored if scored else 0.0,
+                "sign_hit_rate": self.confirmed_signs / self.predicted_signs if self.predicted_signs else 0.0,
+                "misses_avoided": avoided.get("speculate", 0),
+                "final_misses_avoided": avoided.get("confirm", 0),
+                "mean_ready_ms": self.ready_time / self.finals * 1000 if self.finals else 0.0
+            }
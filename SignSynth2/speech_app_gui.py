@@ -3,11 +3,21 @@ from direct.gui.DirectGui import *
 from direct.task import Task
 from panda3d.core import *
 import sys
+import time
 
 # Import custom modules
 from speech_processor import SpeechProcessor
 from media_controller import MediaController
 from pose_animator import PoseAnimator
+from avatar_rig import AvatarRig
+from model_cache import ModelCache
+from animation_queue import AnimationQueue
+from playback_scheduler import PlaybackScheduler, BASE_TRANSITION
+from render_governor import RenderGovernor
+from quality_governor import QualityGovernor
+from scaled_viewport import ScaledViewport
+from sign_timeline import SignTimeline
+from speculative_planner import SpeculativePlanner
 
 
 class SpeechAppGUI(ShowBase):
@@ -26,10 +36,39 @@ class SpeechAppGUI(ShowBase):
         # Initialize running state
         self.running = True
 
+        # Full frame rate only while something on screen is changing
+        self.render_governor = RenderGovernor(self, is_busy=self.is_animation_busy)
+
         # Create default values for media controller
         self.default_pause_interval = 2  # seconds
         self.default_play_interval = 10  # seconds
 
+        # Committed gloss segments waiting for the avatar, fed by the speech thread
+        self.animation_queue = AnimationQueue()
+        self.animating = False
+
+        # Steps of the playing plan, pinned to the monotonic clock
+        self.sign_timeline = SignTimeline()
+
+        # Words signed by a substitute this session and the fingerspelling seconds that saved
+        self.substitutions = 0
+        self.substitution_saved = 0.0
+
+        # Play signs as baked native clips instead of the per-frame blender
+        self.use_baked_clips = False
+        self.current_clip = None
+
+        # Tab content is built on first show and kept afterwards; name -> build time in ms
+        self.tab_builders = {
+            "speech": self.create_speech_tab,
+            "media": self.create_media_control_tab,
+            "animation": self.create_animation_tab
+        }
+        self.tab_build_ms = {}
+
+        # Latest media status, shown when the media tab is first built
+        self.media_status_text = "Status: Idle"
+
         # Create main GUI structure first
         self.create_main_frame()
         self.create_tabs()
@@ -37,16 +76,16 @@ class SpeechAppGUI(ShowBase):
         self.media_controller = MediaController(
             on_status_update=self.update_media_status
         )
-        # Create individual tab content - this creates the status_label
-        self.create_speech_tab()
-        self.create_media_control_tab()
-        self.create_animation_tab()
+        # Only the speech tab is needed up front - this creates the status_label
+        self.ensure_tab("speech")
 
         self.speech_processor = SpeechProcessor(
             on_status_update=self.update_status_label,
             on_transcript_update=self.update_transcript_text,
             on_gloss_update=self.update_gloss_text,
-            on_live_update=self.update_live_label
+            on_live_update=self.update_live_label,
+            on_gloss_segment=self.enqueue_gloss_segment,
+            on_gloss_partial=self.speculate_gloss
         )
 
         # Initially show speech tab
@@ -55,6 +94,9 @@ class SpeechAppGUI(ShowBase):
         # Add a task to check for window close
         self.taskMgr.add(self.check_running, "CheckRunningTask")
 
+        # Feed queued speech into the avatar from the render loop
+        self.taskMgr.add(self.consume_animation_queue, "AnimationQueueTask")
+
 
     def create_main_frame(self):
         """Create the main frame for the application"""
@@ -356,7 +398,7 @@ class SpeechAppGUI(ShowBase):
         # Media status label
         self.media_status = DirectLabel(
             parent=self.media_frame,
-            text="Status: Idle",
+            text=self.media_status_text,
             text_scale=0.05,
             frameColor=(0.9, 0.9, 0.9, 0),
             pos=(0, 0, -0.4)
@@ -375,18 +417,18 @@ class SpeechAppGUI(ShowBase):
         self.animation_frame.hide()
 
         # Create a scene for our animation
+        # The avatar gets its own scene graph rather than render, so the default
+        # full-window camera never draws it; only the viewport's camera does
         self.animation_root = NodePath("animation_root")
-        self.animation_root.reparentTo(render)
         self.animation_root.hide()  # Hide the animation root initially
 
-        # Create the display region properly through the window
-        self.animation_viewport = self.win.makeDisplayRegion(0, 1, 0, 0.7)
-
-        # Setup camera for animation viewport
-        self.animation_camera = self.makeCamera(self.win)
+        # The viewport renders the avatar offscreen at the quality tier's resolution
+        # and shows it stretched over its region of the window
+        self.animation_camera = self.animation_root.attachNewNode(Camera("animation_camera", PerspectiveLens()))
         self.animation_camera.setPos(0, -15, 3.25)
         self.animation_camera.lookAt(0, 0, 3)
-        self.animation_viewport.setCamera(self.animation_camera)
+        self.animation_viewport = ScaledViewport(self, self.animation_camera, (0, 1, 0, 0.7))
+        self.animation_viewport.set_active(False)
 
         # Rest of the method remains the same...
         # Title for animation tab
@@ -397,74 +439,139 @@ class SpeechAppGUI(ShowBase):
             frameColor=(0.9, 0.9, 0.9, 0),
             pos=(0, 0, 0.75)
         )
+
+        # Current quality tier and frame-time histogram
+        self.quality_label = DirectLabel(
+            parent=self.animation_frame,
+            text="Quality: -",
+            text_scale=0.03,
+            text_align=TextNode.ALeft,
+            frameColor=(0.9, 0.9, 0.9, 0),
+            pos=(-0.93, 0, 0.77)
+        )
+        self.quality_label_updated = 0.0
+
+        # Switch between per-frame blending and baked clips
+        self.clips_button = DirectButton(
+            parent=self.animation_frame,
+            text="Clips: Off",
+            text_scale=0.03,
+            frameSize=(-0.15, 0.15, -0.05, 0.05),
+            relief=DGG.RAISED,
+            command=self.toggle_baked_clips,
+            pos=(0.8, 0, 0.75),
+            frameColor=(0.6, 0.6, 0.6, 1)
+        )
+
+        # Animation status label
+        self.animation_status = DirectLabel(
+            parent=self.animation_frame,
+            text="Status: Loading avatar...",
+            text_scale=0.04,
+            frameColor=(0.9, 0.9, 0.9, 0),
+            pos=(0, 0, 0.66)
+        )
+
+        # Manual gloss input, e.g. "HI ME"
+        self.gloss_input = DirectEntry(
+            parent=self.animation_frame,
+            initialText="",
+            width=20,
+            scale=0.05,
+            pos=(-0.8, 0, 0.55),
+            frameColor=(1, 1, 1, 1)
+        )
+
+        # Animate button
+        self.animate_button = DirectButton(
+            parent=self.animation_frame,
+            text="Animate",
+            text_scale=0.03,
+            frameSize=(-0.15, 0.15, -0.05, 0.05),
+            relief=DGG.RAISED,
+            command=self.start_animation,
+            pos=(0.45, 0, 0.56),
+            frameColor=(0.3, 0.6, 0.9, 1)
+        )
+
+        # Reset button
+        self.reset_animation_button = DirectButton(
+            parent=self.animation_frame,
+            text="Reset",
+            text_scale=0.03,
+            frameSize=(-0.15, 0.15, -0.05, 0.05),
+            relief=DGG.RAISED,
+            command=self.reset_animation,
+            pos=(0.8, 0, 0.56),
+            frameColor=(0.9, 0.3, 0.3, 1)
+        )
+
+        # Live queue depth and lag behind speech
+        self.queue_label = DirectLabel(
+            parent=self.animation_frame,
+            text="Queue: 0 | Lag: 0.0s",
+            text_scale=0.035,
+            frameColor=(0.9, 0.9, 0.9, 0),
+            pos=(0, 0, 0.46)
+        )
+
+        # Load the avatar in the background; the animator is attached when it arrives
+        self.load_animation_models()
+
     def load_animation_models(self):
-        """Load the 3D models needed for animation"""
+        """Start loading the avatar in the background; on_animation_models_loaded finishes setup"""
+        # Create a new nodePath for our models
+        self.model_root = NodePath("model_root")
+        self.model_root.reparentTo(self.animation_root)
+
+        # Native .bam copies keyed by content hash; converted from the GLBs on first run
+        self.model_cache = ModelCache(self.loader)
+        try:
+            self.model_cache.load_avatar(self.on_animation_models_loaded)
+        except Exception as e:
+            self.animation_status['text'] = f"Error loading models: {str(e)}"
+            print(f"Error loading models: {str(e)}")
+
+    def on_animation_models_loaded(self, models):
+        """Attach the loaded avatar, resolve its rig and start the animator"""
         try:
-            # Create a new nodePath for our models
-            self.model_root = NodePath("model_root")
-            self.model_root.reparentTo(self.animation_root)
+            if any(model is None for model in models):
+                raise IOError("avatar model files could not be loaded")
+            self.torso, self.rarm, self.larm = models
 
-            # Load the torso model
-            self.torso = loader.loadModel('character/torso.glb')
+            # Torso at the origin, both arms hang off it
             self.torso.setPos(0, 0, 0)
             self.torso.reparentTo(self.model_root)
-
-            # Load the right arm and hand
-            self.rarm = loader.loadModel('character/RArmX.glb')
             self.rarm.reparentTo(self.torso)
-
-            # Find all the finger joints for the right hand
-            self.rthumb1 = self.rarm.find("**/t1")
-            self.rthumb2 = self.rarm.find("**/t2")
-            self.rindex1 = self.rarm.find("**/i1")
-            self.rindex2 = self.rarm.find("**/i2")
-            self.rindex3 = self.rarm.find("**/i3")
-            self.rmiddle1 = self.rarm.find("**/m1")
-            self.rmiddle2 = self.rarm.find("**/m2")
-            self.rmiddle3 = self.rarm.find("**/m3")
-            self.rring1 = self.rarm.find("**/r1")
-            self.rring2 = self.rarm.find("**/r2")
-            self.rring3 = self.rarm.find("**/r3")
-            self.rpinky1 = self.rarm.find("**/p1")
-            self.rpinky2 = self.rarm.find("**/p2")
-            self.rpinky3 = self.rarm.find("**/p3")
-
-            # Load the left arm and hand
-            self.larm = loader.loadModel('character/LArmX.glb')
             self.larm.reparentTo(self.torso)
 
-            # Find all the finger joints for the left hand
-            self.lthumb1 = self.larm.find("**/t1")
-            self.lthumb2 = self.larm.find("**/t2")
-            self.lindex1 = self.larm.find("**/i1")
-            self.lindex2 = self.larm.find("**/i2")
-            self.lindex3 = self.larm.find("**/i3")
-            self.lmiddle1 = self.larm.find("**/m1")
-            self.lmiddle2 = self.larm.find("**/m2")
-            self.lmiddle3 = self.larm.find("**/m3")
-            self.lring1 = self.larm.find("**/r1")
-            self.lring2 = self.larm.find("**/r2")
-            self.lring3 = self.larm.find("**/r3")
-            self.lpinky1 = self.larm.find("**/p1")
-            self.lpinky2 = self.larm.find("**/p2")
-            self.lpinky3 = self.larm.find("**/p3")
+            # Resolve every arm and finger joint once, in compiled pose order
+            self.rig = AvatarRig(self.larm, self.rarm)
+            rig_stats = self.rig.stats()
+            print(f"Avatar rig: {rig_stats['joints']} joints resolved in {rig_stats['resolve_ms']:.2f} ms")
 
             # Setup lighting for the animation
             self.setup_animation_lighting()
 
+            cache_stats = self.model_cache.stats()
+            print(f"Avatar models loaded in {cache_stats['load_ms']:.0f} ms "
+                  f"({cache_stats['bam_hits']} cached, {cache_stats['conversions']} converted)")
             self.animation_status['text'] = "Status: Models loaded successfully"
         except Exception as e:
             self.animation_status['text'] = f"Error loading models: {str(e)}"
             print(f"Error loading models: {str(e)}")
+            return
+
+        self.initialize_animator()
 
     def setup_animation_lighting(self):
         """Setup lighting for the animation scene"""
-        # Create directional light
+        # Create directional light (shadows are switched by the quality tier)
         mainLight = DirectionalLight('main light')
-        mainLight.setShadowCaster(True)
         mainLightNodePath = self.animation_root.attachNewNode(mainLight)
         mainLightNodePath.setHpr(0, -70, 0)
         self.animation_root.setLight(mainLightNodePath)
+        self.main_light = mainLightNodePath
 
         # Create ambient light
         ambientLight = AmbientLight('ambient light')
@@ -472,36 +579,35 @@ class SpeechAppGUI(ShowBase):
         ambientLightNodePath = self.animation_root.attachNewNode(ambientLight)
         self.animation_root.setLight(ambientLightNodePath)
 
-        # Enable auto shader
-        self.animation_root.setShaderAuto()
+        # Shadows, auto-shader, antialiasing and render resolution follow measured frame time
+        self.quality_governor = QualityGovernor(
+            self, self.animation_root, self.main_light, viewport=self.animation_viewport,
+            on_change=self.report_quality_change
+        )
 
     def initialize_animator(self):
         """Initialize the pose animator"""
         try:
-            # Create dictionaries for left and right hand parts
-            left_parts = {
-                "arm": self.larm,
-                "thumb": [self.lthumb1, self.lthumb2],
-                "index": [self.lindex1, self.lindex2, self.lindex3],
-                "middle": [self.lmiddle1, self.lmiddle2, self.lmiddle3],
-                "ring": [self.lring1, self.lring2, self.lring3],
-                "pinky": [self.lpinky1, self.lpinky2, self.lpinky3]
-            }
-
-            right_parts = {
-                "arm": self.rarm,
-                "thumb": [self.rthumb1, self.rthumb2],
-                "index": [self.rindex1, self.rindex2, self.rindex3],
-                "middle": [self.rmiddle1, self.rmiddle2, self.rmiddle3],
-                "ring": [self.rring1, self.rring2, self.rring3],
-                "pinky": [self.rpinky1, self.rpinky2, self.rpinky3]
-            }
-
-            # Create the pose animator with the hand parts
-            self.pose_animator = PoseAnimator(left_parts, right_parts)
+            # Create the pose animator on the resolved rig
+            self.pose_animator = PoseAnimator(self.rig)
+
+            # Blend joints toward the current target every frame
+            self.taskMgr.remove("PoseBlendTask")
+            self.taskMgr.add(self.pose_animator.blender.task, "PoseBlendTask")
+
+            # Speeds up, collapses or drops live segments to keep lag under target
+            self.playback_scheduler = PlaybackScheduler(
+                self.pose_animator.compiler,
+                on_decision=self.report_schedule_decision
+            )
+
+            # Gets signs ready from partial recognition results before the final arrives
+            self.speculative_planner = SpeculativePlanner(
+                self.pose_animator, self.playback_scheduler, is_busy=self.is_animation_busy
+            )
 
             # Apply default pose
-            self.pose_animator.applyPoseInstantly(self.pose_animator.loadPoseNow("default"))
+            self.pose_animator.applyDefaultPose()
 
             self.animation_status['text'] = "Status: Animator initialized"
         except Exception as e:
@@ -517,60 +623,221 @@ class SpeechAppGUI(ShowBase):
             self.animation_status['text'] = "Status: Please enter some gloss text to animate"
             return
 
-        # Set the pose sequence
-        self.pose_animator.pose_sequence = gloss_text.lower().split()
+        self.play_gloss(gloss_text)
+
+    def play_gloss(self, gloss_text, spoken_at=None):
+        """Compile a gloss string and start signing it; returns False if nothing to sign"""
+        if not hasattr(self, 'pose_animator'):
+            self.animation_status['text'] = "Status: Avatar not loaded"
+            return False
 
-        # Expand the sequence
-        self.pose_animator.expanded_sequence = self.pose_animator.expandPoseSequence(self.pose_animator.pose_sequence)
+        # Compile the gloss into pose ids and per-step durations (cached per gloss string)
+        self.pose_animator.pose_sequence = gloss_text.split()
+        self.pose_animator.plan = self.pose_animator.compilePlan(gloss_text)
+        self.pose_animator.expanded_sequence = list(self.pose_animator.plan.labels)
 
-        if not self.pose_animator.expanded_sequence:
+        if not self.pose_animator.plan.pose_ids:
             self.animation_status['text'] = "Status: No valid signs found in input"
-            return
+            return False
+
+        saved = [seconds for seconds in self.pose_animator.plan.saved if seconds]
+        self.substitutions += len(saved)
+        self.substitution_saved += sum(saved)
+
+        # Live speech is paced against the backlog; manual input plays at normal speed
+        if spoken_at is not None:
+            self.pose_animator.plan = self.playback_scheduler.schedule(
+                self.pose_animator.plan, self.animation_queue.snapshot()
+            )
+        else:
+            self.playback_scheduler.speed = 1.0
 
         # Reset the animator index
         self.pose_animator.pose_index = 0
+        self.animating = True
 
-        # Start the animation task
+        # Measure how far the avatar is behind the speech it's about to sign
+        if spoken_at is not None:
+            self.animation_queue.mark_started(spoken_at)
+
+        # Start the animation task with the first pose right away
         self.taskMgr.remove("AnimateSignsTask")
-        self.taskMgr.doMethodLater(0.5, self.animate_next_pose, "AnimateSignsTask")
+        if self.use_baked_clips:
+            speed = self.playback_scheduler.speed
+            self.pose_animator.clip_queue = self.pose_animator.clipsForPlan(
+                self.pose_animator.plan, speed, BASE_TRANSITION
+            )
+            self.taskMgr.doMethodLater(0, self.animate_next_clip, "AnimateSignsTask")
+        else:
+            # Poses follow the timeline every frame, so frame rate never stretches a sign
+            self.sign_timeline.load(self.pose_animator.plan, time.monotonic())
+            self.taskMgr.add(self.animate_timeline, "AnimateSignsTask")
+
+        self.animation_status['text'] = f"Status: Animating {len(self.pose_animator.plan.pose_ids)} signs"
+        return True
+
+    def enqueue_gloss_segment(self, gloss, spoken_at):
+        """Queue a committed gloss segment from the speech thread for the avatar"""
+        queued = self.animation_queue.snapshot()
+        self.animation_queue.push(gloss, spoken_at)
+        self.render_governor.wake()
+
+        # Load its signs now, on the speech thread, so the render loop doesn't wait on disk;
+        # usually they're already prepared from the partial results
+        if hasattr(self, 'speculative_planner'):
+            self.speculative_planner.confirm(gloss, queued)
+
+    def speculate_gloss(self, gloss):
+        """Prepare the stable start of a partial result from the speech thread"""
+        if hasattr(self, 'speculative_planner'):
+            self.speculative_planner.speculate(gloss, self.animation_queue.snapshot())
+
+    def consume_animation_queue(self, task):
+        """Render-loop task: start the next queued segment whenever the avatar is idle"""
+        # Segments wait (bounded) until the animation tab is open and the avatar has
+        # loaded; play_gloss can't start anything before then, so nothing is popped
+        if not hasattr(self, 'pose_animator'):
+            return Task.cont
+
+        if hasattr(self, 'playback_scheduler'):
+            self.playback_scheduler.drop_stale(self.animation_queue)
+
+        if not self.animating:
+            segment = self.animation_queue.pop()
+            while segment and not self.play_gloss(*segment):
+                segment = self.animation_queue.pop()
+
+        self.update_queue_label()
+        return Task.cont
 
-        self.animation_status['text'] = f"Status: Animating {len(self.pose_animator.expanded_sequence)} signs"
+    def update_queue_label(self):
+        """Show queue depth, lag behind speech and playback speed"""
+        stats = self.animation_queue.stats()
+        speed = self.playback_scheduler.speed if hasattr(self, 'playback_scheduler') else 1.0
+        text = (f"Queue: {stats['depth']} | Lag: {stats['last_lag']:.1f}s "
+                f"(avg {stats['mean_lag']:.1f}s, max {stats['max_lag']:.1f}s) | "
+                f"Speed: {speed:.1f}x | Dropped: {stats['dropped']}")
+        if hasattr(self, 'pose_animator') and self.use_baked_clips:
+            clips = self.pose_animator.clip_baker.stats()
+            text += f" | Clips: {clips['clips']} ({clips['bakes']} baked, {clips['hits']} reused)"
+        elif hasattr(self, 'pose_animator'):
+            blend = self.pose_animator.blender.stats()
+            curves = self.pose_animator.transitions.stats()
+            rig = self.rig.stats()
+            timing = self.sign_timeline.stats()
+            text += (f" | Blend: {blend['mean_ms']:.2f} ms/frame "
+                     f"(apply {rig['mean_apply_ms']:.3f} ms) | "
+                     f"Transitions: {curves['hit_rate']:.0%} cached | "
+                     f"Drift: {timing['mean_drift_ms']:.0f} ms (max {timing['max_drift_ms']:.0f}), "
+                     f"{timing['skipped']} skipped")
+        if hasattr(self, 'speculative_planner'):
+            speculation = self.speculative_planner.stats()
+            text += (f" | Speculation: {speculation['hit_rate']:.0%} hit, "
+                     f"{speculation['misses_avoided']} curve builds avoided")
+        if self.substitutions:
+            text += f" | Substituted: {self.substitutions} words, {self.substitution_saved:.1f}s saved"
+        if self.queue_label['text'] != text:
+            self.queue_label['text'] = text
+
+        # The histogram changes every frame; refresh it once a second
+        if hasattr(self, 'quality_governor') and time.monotonic() - self.quality_label_updated > 1.0:
+            self.quality_label['text'] = self.quality_governor.summary()
+            self.quality_label_updated = time.monotonic()
+
+    def report_quality_change(self, tier):
+        """Log a quality tier change"""
+        print(f"Quality: switched to {tier.name} tier")
+        self.quality_label_updated = 0.0
+
+    def is_animation_busy(self):
+        """Return True while the avatar is moving"""
+        if self.animating:
+            return True
+        return hasattr(self, 'pose_animator') and self.pose_animator.blender.active
+
+    def report_schedule_decision(self, text):
+        """Show and log a playback scheduler decision"""
+        print(f"Scheduler: {text}")
+        self.animation_status['text'] = f"Status: {text}"
+
+    def animate_timeline(self, task):
+        """Per-frame task: start whichever pose the timeline says is due"""
+        plan = self.pose_animator.plan
+        now = time.monotonic()
+
+        # A late frame jumps to the current step; its blend starts from the scheduled
+        # time, so the avatar catches up instead of running behind
+        index = self.sign_timeline.advance(now)
+        if index is not None:
+            pose_name = plan.labels[index]
+            pose_id = plan.pose_ids[index]
+            transition = min(self.playback_scheduler.transition_time(), plan.durations[index])
+            self.pose_animator.animatePose(self.pose_animator.getPose(pose_id), transition, pose_id,
+                                           self.sign_timeline.starts[index])
+            self.pose_animator.current_pose = pose_name
+            self.pose_animator.pose_index = index + 1
+            self.animation_status['text'] = f"Status: Sign {index + 1}/{len(plan.pose_ids)}: {pose_name}"
+
+        if self.sign_timeline.finished(now):
+            self.animating = False
 
-    def animate_next_pose(self, task):
-        """Task to animate the next pose in sequence"""
-        if self.pose_animator.pose_index >= len(self.pose_animator.expanded_sequence):
-            # End of sequence, reset to default
-            self.pose_animator.applyPoseInstantly(self.pose_animator.loadPoseNow("default"))
+            # Go straight on to queued speech; rest in the default pose only when idle
+            if self.animation_queue.depth():
+                return Task.done
+            self.pose_animator.applyDefaultPose()
             self.animation_status['text'] = "Status: Animation complete"
             return Task.done
+        return Task.cont
 
-        # Get the next pose name
-        pose_name = self.pose_animator.expanded_sequence[self.pose_animator.pose_index]
+    def animate_next_clip(self, task):
+        """Task to start the next baked clip; the interval manager plays it"""
+        clip_queue = self.pose_animator.clip_queue
+        index = self.pose_animator.pose_index
 
-        # Load and apply the pose
-        pose = self.pose_animator.loadPoseNow(pose_name)
+        if index >= len(clip_queue):
+            self.animating = False
+            self.current_clip = None
+            self.pose_animator.blender.sync()
 
-        if pose:
-            self.pose_animator.animatePose(pose, 0.1)  # Use slightly slower animation for clarity
-            self.pose_animator.current_pose = pose_name
-            self.animation_status[
-                'text'] = f"Status: Sign {self.pose_animator.pose_index + 1}/{len(self.pose_animator.expanded_sequence)}: {pose_name}"
-        else:
-            self.animation_status['text'] = f"Status: Could not load pose: {pose_name}"
+            # Go straight on to queued speech; rest in the default pose only when idle
+            if self.animation_queue.depth():
+                return Task.done
+            self.pose_animator.applyDefaultPose()
+            self.animation_status['text'] = "Status: Animation complete"
+            return Task.done
 
-        # Increment pose index
-        self.pose_animator.pose_index += 1
+        label, clip = clip_queue[index]
+        self.current_clip = clip
+        task.delayTime = self.pose_animator.playClip(clip, self.playback_scheduler.speed)
+        self.pose_animator.current_pose = label
+        self.animation_status['text'] = f"Status: Sign {index + 1}/{len(clip_queue)}: {label}"
 
-        # Schedule next pose after a delay
+        self.pose_animator.pose_index += 1
         return task.again
 
+    def toggle_baked_clips(self):
+        """Switch sign playback between the per-frame blender and baked clips"""
+        self.reset_animation()
+        self.use_baked_clips = not self.use_baked_clips
+        self.clips_button['text'] = "Clips: On" if self.use_baked_clips else "Clips: Off"
+        self.clips_button['frameColor'] = (0.3, 0.6, 0.9, 1) if self.use_baked_clips else (0.6, 0.6, 0.6, 1)
+
     def reset_animation(self):
         """Reset the animation to default pose"""
-        # Remove animation task
+        # Remove animation task, stop any baked clip and drop queued speech
         self.taskMgr.remove("AnimateSignsTask")
+        if self.current_clip is not None:
+            self.current_clip.pause()
+            self.current_clip = None
+            self.pose_animator.blender.sync()
+        self.animation_queue.clear()
+        self.animating = False
+
+        if not hasattr(self, 'pose_animator'):
+            return
 
         # Apply default pose
-        self.pose_animator.applyPoseInstantly(self.pose_animator.loadPoseNow("default"))
+        self.pose_animator.applyDefaultPose()
 
         # Reset pose index
         self.pose_animator.pose_index = 0
@@ -580,58 +847,68 @@ class SpeechAppGUI(ShowBase):
 
         self.animation_status['text'] = "Status: Animation reset"
 
+    def ensure_tab(self, name):
+        """Build a tab's widgets (and scene, for the animation tab) the first time it's needed"""
+        if name in self.tab_build_ms:
+            return
+        start = time.perf_counter()
+        self.tab_builders[name]()
+        self.tab_build_ms[name] = (time.perf_counter() - start) * 1000
+        print(f"Built {name} tab in {self.tab_build_ms[name]:.1f} ms")
+
+    def show_tab(self, name):
+        """Show one tab, building it on first use, and hide the others"""
+        self.ensure_tab(name)
+
+        frames = {"speech": "speech_frame", "media": "media_frame", "animation": "animation_frame"}
+        for tab, frame in frames.items():
+            if tab not in self.tab_build_ms:
+                continue
+            if tab == name:
+                getattr(self, frame).show()
+            else:
+                getattr(self, frame).hide()
+        if "animation" in self.tab_build_ms:
+            if name == "animation":
+                self.animation_root.show()
+            else:
+                self.animation_root.hide()
+            # Hidden avatar viewport is neither culled nor drawn, offscreen or on screen
+            active = name == "animation"
+            if self.animation_viewport.active != active:
+                self.animation_viewport.set_active(active)
+                self.render_governor.wake()
+
+        buttons = {"speech": self.speech_tab_btn, "media": self.media_tab_btn, "animation": self.animation_tab_btn}
+        for tab, button in buttons.items():
+            button["frameColor"] = (0.6, 0.6, 0.8, 1) if tab == name else (0.6, 0.6, 0.6, 1)
+
     def show_speech_tab(self):
         """Show speech recognition tab"""
-        self.speech_frame.show()
-        self.media_frame.hide()
-        if hasattr(self, 'animation_frame'):
-            self.animation_frame.hide()
-        if hasattr(self, 'animation_root'):
-            self.animation_root.hide()
-
-        self.speech_tab_btn["frameColor"] = (0.6, 0.6, 0.8, 1)
-        self.media_tab_btn["frameColor"] = (0.6, 0.6, 0.6, 1)
-        self.animation_tab_btn["frameColor"] = (0.6, 0.6, 0.6, 1)
+        self.show_tab("speech")
 
     def show_media_tab(self):
         """Show media control tab"""
-        self.speech_frame.hide()
-        self.media_frame.show()
-        if hasattr(self, 'animation_frame'):
-            self.animation_frame.hide()
-        if hasattr(self, 'animation_root'):
-            self.animation_root.hide()
-
-        self.speech_tab_btn["frameColor"] = (0.6, 0.6, 0.6, 1)
-        self.media_tab_btn["frameColor"] = (0.6, 0.6, 0.8, 1)
-        self.animation_tab_btn["frameColor"] = (0.6, 0.6, 0.6, 1)
+        self.show_tab("media")
 
     def show_animation_tab(self):
         """Show animation tab"""
-        if not hasattr(self, 'animation_frame'):
-            print("Animation frame not created yet!")
-            return
-
-        self.speech_frame.hide()
-        self.media_frame.hide()
-        self.animation_frame.show()
-        self.animation_root.show()
-
-        self.speech_tab_btn["frameColor"] = (0.6, 0.6, 0.6, 1)
-        self.media_tab_btn["frameColor"] = (0.6, 0.6, 0.6, 1)
-        self.animation_tab_btn["frameColor"] = (0.6, 0.6, 0.8, 1)
+        self.show_tab("animation")
 
     def update_status_label(self, text):
         """Update the status label text"""
         self.status_label["text"] = text
+        self.render_governor.wake()
 
     def update_live_label(self, text):
         """Update the live listening label text"""
         self.live_label["text"] = text
+        self.render_governor.wake()
 
     def update_transcript_text(self, text):
         """Update the transcript text area"""
         self.transcript_display.setText(text)
+        self.render_governor.wake()
 
         # Adjust canvas size if needed
         text_height = len(text.split('\n')) * 0.06
@@ -641,6 +918,7 @@ class SpeechAppGUI(ShowBase):
     def update_gloss_text(self, text):
         """Update the gloss text area"""
         self.gloss_display.setText(text)
+        self.render_governor.wake()
 
         # Adjust canvas size if needed
         text_height = len(text.split('\n')) * 0.07
@@ -649,7 +927,10 @@ class SpeechAppGUI(ShowBase):
 
     def update_media_status(self, text):
         """Update the media status label"""
-        self.media_status["text"] = text
+        self.media_status_text = text
+        if "media" in self.tab_build_ms:
+            self.media_status["text"] = text
+            self.render_governor.wake()
 
     def reset_transcript(self):
         """Reset the transcript and gloss"""
@@ -709,6 +990,19 @@ class SpeechAppGUI(ShowBase):
         """Clean up resources before closing"""
         self.running = False
 
+        stats = self.render_governor.stats()
+        print(f"Render governor: active {stats['active_cpu_pct']:.0f}% CPU over {stats['active_seconds']:.0f}s, "
+              f"idle {stats['idle_cpu_pct']:.0f}% CPU over {stats['idle_seconds']:.0f}s")
+        if hasattr(self, 'speculative_planner'):
+            stats = self.speculative_planner.stats()
+            print(f"Speculation: {stats['hits']} hits, {stats['misses']} misses "
+                  f"({stats['sign_hit_rate']:.0%} of predicted signs); "
+                  f"render-loop curve builds avoided: {stats['misses_avoided']} by speculation, "
+                  f"{stats['final_misses_avoided']} by preparing finals; "
+                  f"final ready in {stats['mean_ready_ms']:.2f} ms on average")
+        print(f"Substitution: {self.substitutions} words signed by a substitute, "
+              f"{self.substitution_saved:.1f}s of fingerspelling saved")
+
         # Clean up speech processor and media controller
         if hasattr(self, 'speech_processor'):
             self.speech_processor.cleanup()
@@ -5,23 +5,14 @@ import re
 import difflib
 from collections import deque
 
-# Import speech recognition libraries
-from vosk import Model, KaldiRecognizer
-import pyaudio
-
-# Import NLP tools
-import nltk
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
-import string
+if __name__ == "__main__":
+    # Run directly as a test harness: the gloss engine is in the repository root
+    import os
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# Ensure NLTK resources are downloaded
-try:
-    nltk.data.find('tokenizers/punkt')
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('punkt')
-    nltk.download('stopwords')
+from gloss_engine import get_engine
+from gloss_tokenizer import TOKENIZER_MODES
 
 
 class SpeechProcessor:
@@ -29,13 +20,16 @@ class SpeechProcessor:
 
     def __init__(self, model_path="C:\\Users\\DELL\\PycharmProjects\\ASR\\vosk-model-small-en-us-0.15",
                  on_status_update=None, on_transcript_update=None,
-                 on_gloss_update=None, on_live_update=None):
+                 on_gloss_update=None, on_live_update=None, tokenizer_mode="fast",
+                 on_gloss_segment=None, on_gloss_partial=None):
         """Initialize speech processor with callback functions"""
         # Callback functions
         self.on_status_update = on_status_update
         self.on_transcript_update = on_transcript_update
         self.on_gloss_update = on_gloss_update
         self.on_live_update = on_live_update
+        self.on_gloss_segment = on_gloss_segment
+        self.on_gloss_partial = on_gloss_partial
 
         # Initialize state variables
         self.running = True
@@ -49,12 +43,23 @@ class SpeechProcessor:
         self.recent_segments = deque(maxlen=10)
         self.min_similarity_threshold = 0.7
 
+        # Words of the previous partial result, and the prefix that stayed the same
+        # across partials - the part worth preparing signs for before the final arrives
+        self.last_partial_words = []
+        self.stable_words = []
+
+        self.tokenizer_mode = tokenizer_mode
+
         # Setup Vosk and start listening
         self.setup_speech_recognition()
 
     def setup_speech_recognition(self):
         """Setup speech recognition system"""
         try:
+            # Import speech recognition libraries here so importing this module stays cheap
+            from vosk import Model, KaldiRecognizer
+            import pyaudio
+
             # Setup Vosk model
             self.model = Model(self.model_path)
             self.recognizer = KaldiRecognizer(self.model, 16000)
@@ -70,7 +75,7 @@ class SpeechProcessor:
             )
             self.stream.start_stream()
 
-            # Load stopwords and prepare gloss mapping
+            # Attach the shared gloss engine
             self.load_nlp_resources()
 
             # Start the listening thread
@@ -85,26 +90,8 @@ class SpeechProcessor:
             print(f"Error initializing: {e}")
 
     def load_nlp_resources(self):
-        """Load stopwords and prepare gloss mapping dictionary"""
-        # Stopwords with pronouns kept
-        self.stop_words = set(stopwords.words('english')) - {
-            'i', 'you', 'we', 'he', 'she', 'they', 'me', 'my', 'your', 'our', 'his', 'her', 'their'
-        }
-
-        # Gloss mapping for sign language
-        self.gloss_map = {
-            "i": "ME", "you": "YOU", "we": "US", "he": "HE", "she": "SHE", "they": "THEY",
-            "am": "", "is": "", "are": "", "was": "", "were": "",
-            "going": "GO", "go": "GO", "want": "WANT", "have": "HAVE", "had": "HAVE",
-            "don't": "NOT", "not": "NOT", "no": "NOT", "won't": "NOT WILL",
-            "store": "STORE", "because": "WHY", "milk": "MILK", "to": "",
-            "the": "", "a": "", "an": "", "and": "PLUS", "but": "BUT",
-            "this": "THIS", "that": "THAT", "there": "THERE", "here": "HERE",
-            "what": "WHAT", "who": "WHO", "where": "WHERE", "when": "WHEN", "why": "WHY", "how": "HOW",
-            "need": "NEED", "can": "CAN", "will": "WILL", "should": "SHOULD", "must": "MUST",
-            "good": "GOOD", "bad": "BAD", "happy": "HAPPY", "sad": "SAD",
-            "yes": "YES", "okay": "OK", "like": "LIKE", "help": "HELP"
-        }
+        """Attach the shared gloss engine (rules, stopwords and cache)"""
+        self.gloss_engine = get_engine()
 
     def send_status_update(self, text):
         """Send status update via callback if available"""
@@ -126,6 +113,16 @@ class SpeechProcessor:
         if self.on_live_update:
             self.on_live_update(text)
 
+    def send_gloss_segment(self, gloss, spoken_at):
+        """Send a newly committed gloss segment (e.g. to the avatar) if a callback is set"""
+        if self.on_gloss_segment:
+            self.on_gloss_segment(gloss, spoken_at)
+
+    def send_gloss_partial(self, gloss):
+        """Send the gloss of a partial result's stable prefix (e.g. for speculative preparation)"""
+        if self.on_gloss_partial:
+            self.on_gloss_partial(gloss)
+
     def toggle_recognition(self):
         """Toggle speech recognition on/off"""
         self.recognition_active = not self.recognition_active
@@ -175,6 +172,9 @@ class SpeechProcessor:
         if not text or self.is_duplicate_segment(text):
             return False
 
+        # Time the segment was recognized, for measuring avatar lag
+        spoken_at = time.monotonic()
+
         # Clean and prepare text
         cleaned_text = re.sub(r'\s+', ' ', text).strip()
 
@@ -204,23 +204,44 @@ class SpeechProcessor:
         self.send_transcript_update(self.full_transcript)
         self.send_gloss_update(self.full_gloss)
 
+        # Stream the committed segment, stamped with when it was recognized
+        if gloss_string:
+            self.send_gloss_segment(gloss_string, spoken_at)
+
         return True
 
+    def update_stable_prefix(self, partial_text):
+        """Track the words a partial result shares with the previous one
+
+        Returns the stable prefix text when it has grown, otherwise None.
+        """
+        words = partial_text.lower().split()
+        stable = []
+        for word, previous in zip(words, self.last_partial_words):
+            if word != previous:
+                break
+            stable.append(word)
+        self.last_partial_words = words
+
+        if len(stable) <= len(self.stable_words) and stable == self.stable_words[:len(stable)]:
+            return None
+        self.stable_words = stable
+        return " ".join(stable) if stable else None
+
+    def reset_partial(self):
+        """Forget partial results once an utterance is final"""
+        self.last_partial_words = []
+        self.stable_words = []
+
+    def set_tokenizer_mode(self, mode):
+        """Switch between the fast recognizer tokenizer and NLTK"""
+        if mode not in TOKENIZER_MODES:
+            raise ValueError(f"Unknown tokenizer mode: {mode}")
+        self.tokenizer_mode = mode
+
     def convert_to_sign_gloss(self, text):
         """Convert normal text to sign language gloss notation"""
-        words = word_tokenize(text.lower())
-        words = [word for word in words if word not in string.punctuation]
-        filtered = [word for word in words if word not in self.stop_words or word.lower() in self.gloss_map]
-
-        gloss_sequence = []
-        for word in filtered:
-            gloss_word = self.gloss_map.get(word.lower(), word.upper())
-            if gloss_word:  # Only add non-empty strings
-                gloss_sequence.append(gloss_word)
-
-        gloss_string = " ".join(gloss_sequence)
-        gloss_json = {"gloss_sequence": gloss_sequence}
-        return gloss_string, gloss_json
+        return self.gloss_engine.convert(text, self.tokenizer_mode)
 
     def listen(self):
         """Main listening function that processes audio and updates transcript"""
@@ -239,6 +260,7 @@ class SpeechProcessor:
                     # Process final results
                     result = json.loads(self.recognizer.Result())
                     final_text = result.get("text", "").strip()
+                    self.reset_partial()
 
                     if final_text:
                         speaking = True
@@ -267,6 +289,12 @@ class SpeechProcessor:
                         # Also convert partial text to gloss for live preview
                         partial_gloss, _ = self.convert_to_sign_gloss(partial_text)
                         self.send_live_update(f"Listening: {partial_text} → {partial_gloss}")
+
+                        # Words that held steady across partials rarely change in the final
+                        stable_text = self.update_stable_prefix(partial_text)
+                        if stable_text and self.on_gloss_partial:
+                            stable_gloss, _ = self.convert_to_sign_gloss(stable_text)
+                            self.send_gloss_partial(stable_gloss)
                     else:
                         # No speech detected
                         if speaking:
@@ -312,6 +340,10 @@ class SpeechProcessor:
         """Return whether setup was successful"""
         return self.setup_successful
 
+    def get_gloss_cache_stats(self):
+        """Return hit/miss/eviction counters for the gloss cache"""
+        return self.gloss_engine.stats(self.tokenizer_mode)
+
 
 # For testing the module independently
 if __name__ == "__main__":
@@ -0,0 +1,114 @@
+import threading
+import time
+
+import numpy as np
+
+from lru_cache import LRUCache
+from pose_library import HPR
+
+# Curve samples per second of transition
+SAMPLE_RATE = 60
+
+
+class TransitionCache:
+    """Memoized transition curves between library poses
+
+    A curve is the eased blend from one pose to another, sampled at
+    SAMPLE_RATE into an [sample, joint, pos/hpr, xyz] array. Curves are built
+    on first use and kept in an LRU keyed by (from pose id, to pose id,
+    duration), so frequent pairs (fingerspelled letter pairs, ME -> WANT)
+    cost one lookup. Only fully specified source poses are cacheable: a pose
+    with unset joints doesn't pin down the rig's state.
+
+    Curves built ahead of playback pass warmed_by (e.g. "speculate"); the
+    first time the render loop then hits one, it's counted in avoided under
+    that tag, as a render-loop build the warm-up saved. hits and misses count
+    render-loop lookups only.
+    """
+
+    def __init__(self, library, max_curves=1024):
+        self.library = library
+        self.easing = None
+        self.curves = LRUCache(max_curves, on_evict=self.evicted)
+        self.lock = threading.Lock()
+
+        # Warmed curves the render loop hasn't asked for yet: key -> warmed_by tag
+        self.warmed = {}
+
+        # Build counters; build_time in seconds
+        self.builds = 0
+        self.avoided = {}
+        self.build_time = 0.0
+
+    def cacheable(self, pose_id):
+        """Return True if a pose sets every joint, so the rig state after it is known"""
+        return pose_id is not None and not np.isnan(self.library.pose(pose_id)).any()
+
+    def build(self, from_id, to_id, duration):
+        """Sample the eased blend between two poses"""
+        source = self.library.pose(from_id)
+        target = self.library.pose(to_id)
+        target = np.where(np.isnan(target), source, target)
+        delta = target - source
+        delta[:, HPR] = (delta[:, HPR] + 180.0) % 360.0 - 180.0
+
+        samples = max(2, int(round(duration * SAMPLE_RATE)) + 1)
+        weights = self.easing(np.linspace(0.0, 1.0, samples)).astype(np.float32)
+        curve = source + delta * weights[:, None, None, None]
+        curve.flags.writeable = False
+        return curve
+
+    def curve(self, from_id, to_id, duration, warmed_by=None):
+        """Return the cached curve between two poses, building it on a miss"""
+        key = (from_id, to_id, round(duration, 3))
+        curve = self.curves.get(key, count=warmed_by is None)
+        if curve is not None:
+            if warmed_by is None:
+                with self.lock:
+                    tag = self.warmed.pop(key, None)
+                    if tag is not None:
+                        self.avoided[tag] = self.avoided.get(tag, 0) + 1
+            return curve
+
+        started = time.perf_counter()
+        curve = self.build(from_id, to_id, duration)
+        elapsed = time.perf_counter() - started
+
+        with self.lock:
+            self.build_time += elapsed
+            self.builds += 1
+            if warmed_by is not None:
+                self.warmed[key] = warmed_by
+        self.curves.put(key, curve)
+        return curve
+
+    def evicted(self, key, curve):
+        """Forget that an evicted curve was warmed"""
+        with self.lock:
+            self.warmed.pop(key, None)
+
+    def set_easing(self, easing):
+        """Use a new easing function; curves built with the old one are dropped"""
+        self.easing = easing
+        self.clear()
+
+    def clear(self):
+        """Drop every cached curve"""
+        self.curves.clear()
+        with self.lock:
+            self.warmed.clear()
+
+    def stats(self):
+        """Return render-loop cache counters, builds avoided by warming and mean build cost in ms"""
+        curves = self.curves.stats()
+        with self.lock:
+            return {
+                "curves": curves["size"],
+                "max_curves": curves["max_size"],
+                "hits": curves["hits"],
+                "misses": curves["misses"],
+                "evictions": curves["evictions"],
+                "hit_rate": curves["hit_rate"],
+                "avoided": dict(self.avoided),
+                "mean_build_ms": self.build_time / self.builds * 1000 if self.builds else 0.0
+            }
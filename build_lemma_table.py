@@ -0,0 +1,128 @@
+import os
+import re
+
+from nlp_resources import DATA_DIR, LEMMAS_PATH
+
+VOCABULARY_PATH = os.path.join(DATA_DIR, "lemma_vocabulary.txt")
+
+# Verb forms regular suffix rules can't produce; these replace the "-ed" form
+IRREGULAR_VERBS = {
+    "go": ["went", "gone"], "have": ["had"], "do": ["did", "done"], "mean": ["meant"],
+    "come": ["came"], "eat": ["ate", "eaten"], "see": ["saw", "seen"], "give": ["gave", "given"],
+    "take": ["took", "taken"], "make": ["made"], "buy": ["bought"], "bring": ["brought"],
+    "think": ["thought"], "teach": ["taught"], "catch": ["caught"], "fight": ["fought"],
+    "feel": ["felt"], "keep": ["kept"], "sleep": ["slept"], "meet": ["met"], "send": ["sent"],
+    "spend": ["spent"], "lend": ["lent"], "build": ["built"], "lose": ["lost"], "find": ["found"],
+    "hear": ["heard"], "hold": ["held"], "stand": ["stood"], "understand": ["understood"],
+    "sell": ["sold"], "tell": ["told"], "say": ["said"], "pay": ["paid"], "run": ["ran"],
+    "sit": ["sat"], "win": ["won"], "swim": ["swam", "swum"], "sing": ["sang", "sung"],
+    "ring": ["rang", "rung"], "drink": ["drank", "drunk"], "drive": ["drove", "driven"],
+    "ride": ["rode", "ridden"], "write": ["wrote", "written"], "speak": ["spoke", "spoken"],
+    "break": ["broke", "broken"], "choose": ["chose", "chosen"], "forget": ["forgot", "forgotten"],
+    "forgive": ["forgave", "forgiven"], "wake": ["woke", "woken"], "wear": ["wore", "worn"],
+    "steal": ["stole", "stolen"], "throw": ["threw", "thrown"], "grow": ["grew", "grown"],
+    "know": ["knew", "known"], "fly": ["flew", "flown"], "fall": ["fell", "fallen"],
+    "hide": ["hid", "hidden"], "get": ["got", "gotten"], "lie": ["lay", "lain"],
+    "leave": [],  # "left" is far more often the direction than the verb
+}
+
+# Third-person forms that replace the regular "-s" form
+IRREGULAR_THIRD_PERSON = {"have": "has", "do": "does", "go": "goes"}
+
+# Noun plurals regular suffix rules can't produce; these replace the "-s" form
+IRREGULAR_PLURALS = {
+    "child": "children", "man": "men", "woman": "women", "person": "people",
+}
+
+# Verbs whose past tense is the lemma itself, so no "-ed" form is generated
+UNCHANGED_PAST = {"cut", "hit", "hurt", "let", "put", "quit", "cost", "read", "set"}
+
+# Two-syllable verbs stressed on the last syllable also double (forget -> forgetting)
+DOUBLED_FINAL_CONSONANT = {"forget", "prefer", "begin", "admit", "occur", "regret"}
+
+VOWELS = "aeiou"
+CVC_RE = re.compile(r"^(?:[^aeiou]|qu)*[aeiou][^aeiouwxy]$")
+
+
+def doubles_final_consonant(word):
+    """Return True for one-vowel words ending consonant-vowel-consonant (stop -> stopped)"""
+    return word in DOUBLED_FINAL_CONSONANT or bool(CVC_RE.match(word))
+
+
+def plural_or_third_person(word):
+    """Return the -s form of word"""
+    if word.endswith(("s", "x", "z", "ch", "sh")):
+        return word + "es"
+    if word.endswith("o") and word[-2:-1] not in VOWELS:
+        return word + "es"
+    if word.endswith("y") and word[-2:-1] not in VOWELS:
+        return word[:-1] + "ies"
+    return word + "s"
+
+
+def past_tense(word):
+    """Return the regular -ed form of word"""
+    if word.endswith("e"):
+        return word + "d"
+    if word.endswith("y") and word[-2:-1] not in VOWELS:
+        return word[:-1] + "ied"
+    if doubles_final_consonant(word):
+        return word + word[-1] + "ed"
+    return word + "ed"
+
+
+def present_participle(word):
+    """Return the -ing form of word"""
+    if word.endswith("ie"):
+        return word[:-2] + "ying"
+    if word.endswith("e") and not word.endswith("ee") and len(word) > 2:
+        return word[:-1] + "ing"
+    if doubles_final_consonant(word):
+        return word + word[-1] + "ing"
+    return word + "ing"
+
+
+def inflections(lemma, part_of_speech):
+    """Return the inflected forms of a verb ("v") or noun ("n") lemma"""
+    if part_of_speech == "n":
+        return {IRREGULAR_PLURALS.get(lemma) or plural_or_third_person(lemma)}
+
+    forms = {IRREGULAR_THIRD_PERSON.get(lemma) or plural_or_third_person(lemma), present_participle(lemma)}
+    if lemma in IRREGULAR_VERBS:
+        forms.update(IRREGULAR_VERBS[lemma])
+    elif lemma not in UNCHANGED_PAST:
+        forms.add(past_tense(lemma))
+    return forms
+
+
+def build_lemma_table(vocabulary):
+    """Map every generated inflection to its lemma, never remapping a lemma"""
+    lemmas = {lemma for lemma, _ in vocabulary}
+    table = {}
+    for lemma, part_of_speech in sorted(vocabulary):
+        for form in inflections(lemma, part_of_speech):
+            # A form that is itself a lemma keeps its own sign; first lemma wins on clashes
+            if form not in lemmas and form not in table:
+                table[form] = lemma
+    return table
+
+
+def read_vocabulary(path=VOCABULARY_PATH):
+    """Read (lemma, part of speech) pairs, skipping blank lines and # comments"""
+    vocabulary = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                lemma, part_of_speech = line.split("\t")
+                vocabulary.append((lemma, part_of_speech))
+    return vocabulary
+
+
+# Regenerate data/lemmas.tsv from data/lemma_vocabulary.txt
+if __name__ == "__main__":
+    table = build_lemma_table(read_vocabulary())
+    with open(LEMMAS_PATH, "w", encoding="utf-8") as f:
+        for form in sorted(table):
+            f.write(f"{form}\t{table[form]}\n")
+    print(f"Wrote {len(table)} inflections to {LEMMAS_PATH}")
@@ -0,0 +1,51 @@
+import os
+import subprocess
+import sys
+
+# Cold-import budget for the speech processor module, in milliseconds.
+# Importing it must not load NLTK, Vosk or PyAudio or touch the network.
+IMPORT_BUDGET_MS = 50
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_DIRS = ["SignSynth", "SignSynth2"]
+
+MEASURE_SNIPPET = (
+    "import time, sys\n"
+    "start = time.perf_counter()\n"
+    "import {module}\n"
+    "elapsed = (time.perf_counter() - start) * 1000\n"
+    "heavy = [m for m in ('nltk', 'vosk', 'pyaudio') if m in sys.modules]\n"
+    "print(elapsed, ','.join(heavy))\n"
+)
+
+
+def measure_import_ms(module, cwd, runs=5):
+    """Return the best-of-runs cold import time and any heavy modules pulled in"""
+    best = None
+    heavy = ""
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", MEASURE_SNIPPET.format(module=module)],
+            cwd=cwd, capture_output=True, text=True, check=True,
+            # The apps import the gloss engine from the root, as their main.py arranges
+            env=dict(os.environ, PYTHONPATH=ROOT_DIR)
+        ).stdout.split()
+        elapsed = float(output[0])
+        heavy = output[1] if len(output) > 1 else ""
+        best = elapsed if best is None else min(best, elapsed)
+    return best, heavy
+
+
+if __name__ == "__main__":
+    over_budget = False
+
+    for app_dir in APP_DIRS:
+        elapsed, heavy = measure_import_ms("speech_processor", os.path.join(ROOT_DIR, app_dir))
+        ok = elapsed <= IMPORT_BUDGET_MS and not heavy
+        over_budget = over_budget or not ok
+
+        status = "OK" if ok else "OVER BUDGET"
+        extra = f" (imported {heavy})" if heavy else ""
+        print(f"{app_dir}/speech_processor: {elapsed:.1f} ms / {IMPORT_BUDGET_MS} ms {status}{extra}")
+
+    sys.exit(1 if over_budget else 0)
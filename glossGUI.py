@@ -8,77 +8,27 @@ import time
 import re
 from collections import deque
 import difflib
-import nltk
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
-import string
-import os
+
+from gloss_engine import get_engine
+from gloss_tokenizer import TOKENIZER_MODES
 
 
 class GlossConverter:
     """Class for converting English text to sign language gloss notation"""
 
-    def __init__(self):
-        # Check if NLTK data exists and download if needed
-        self.ensure_nltk_resources()
-
-        # Stopwords with pronouns kept
-        self.stop_words = set(stopwords.words('english')) - {
-            'i', 'you', 'we', 'he', 'she', 'they', 'me', 'my', 'your', 'our', 'his', 'her', 'their'
-        }
-
-        # Mapping for common words to their gloss representation
-        self.gloss_map = {
-            "i": "ME", "you": "YOU", "we": "US", "he": "HE", "she": "SHE", "they": "THEY",
-            "am": "", "is": "", "are": "", "was": "", "were": "",
-            "going": "GO", "go": "GO", "want": "WANT", "have": "HAVE", "had": "HAVE",
-            "don't": "NOT", "not": "NOT", "doesn't": "NOT", "didn't": "NOT",
-            "store": "STORE", "because": "", "milk": "MILK", "to": "",
-            "the": "", "a": "", "an": "", "and": "", "or": "", "but": "",
-            "this": "THIS", "that": "THAT", "these": "THESE", "those": "THOSE",
-            "for": "FOR", "with": "WITH", "without": "WITHOUT",
-            "can": "CAN", "cannot": "CANNOT", "could": "COULD", "would": "WOULD", "should": "SHOULD",
-            "yes": "YES", "no": "NO", "maybe": "MAYBE",
-            "like": "LIKE", "need": "NEED", "think": "THINK",
-            "today": "TODAY", "tomorrow": "TOMORROW", "yesterday": "YESTERDAY",
-            "now": "NOW", "later": "LATER", "soon": "SOON",
-            "here": "HERE", "there": "THERE"
-        }
-
-    def ensure_nltk_resources(self):
-        """Ensure NLTK resources are downloaded"""
-        nltk_data_path = os.path.expanduser('~/nltk_data')
-
-        # Check if the resources already exist
-        punkt_exists = os.path.exists(os.path.join(nltk_data_path, 'tokenizers', 'punkt'))
-        stopwords_exists = os.path.exists(os.path.join(nltk_data_path, 'corpora', 'stopwords'))
-
-        # Download only if needed
-        if not punkt_exists:
-            nltk.download('punkt', quiet=True)
-        if not stopwords_exists:
-            nltk.download('stopwords', quiet=True)
+    def __init__(self, tokenizer_mode="fast"):
+        self.tokenizer_mode = tokenizer_mode
+        self.gloss_engine = get_engine()
+
+    def set_tokenizer_mode(self, mode):
+        """Switch between the fast recognizer tokenizer and NLTK"""
+        if mode not in TOKENIZER_MODES:
+            raise ValueError(f"Unknown tokenizer mode: {mode}")
+        self.tokenizer_mode = mode
 
     def convert_to_sign_gloss(self, text):
         """Convert English text to sign language gloss notation"""
-        # Tokenize the input text
-        words = word_tokenize(text.lower())
-
-        # Remove punctuation
-        words = [word for word in words if word not in string.punctuation]
-
-        # Filter out stopwords (except pronouns)
-        filtered = [word for word in words if word not in self.stop_words]
-
-        # Convert to gloss using the mapping, skip empty strings
-        gloss_sequence = [self.gloss_map.get(word, word.upper()) for word in filtered]
-        gloss_sequence = [term for term in gloss_sequence if term]  # Remove empty strings
-
-        # Return both string and structured format
-        gloss_string = " ".join(gloss_sequence)
-        gloss_json = {"gloss_sequence": gloss_sequence}
-
-        return gloss_string, gloss_json
+        return self.gloss_engine.convert(text, self.tokenizer_mode)
 
 
 class SpeechRecognitionApp:
@@ -0,0 +1,192 @@
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import re
+import sys
+import time
+from collections import deque
+
+from gloss_engine import get_engine
+from gloss_tokenizer import TOKENIZER_MODES, nltk_available
+
+# Inputs shorter than this are converted in-process; the pool isn't worth it
+PARALLEL_THRESHOLD = 2000
+
+SRT_TIMING_RE = re.compile(r"^(\S+)\s*-->\s*(\S+)")
+SRT_TAG_RE = re.compile(r"<[^>]+>|\{[^}]+\}")
+
+
+def _convert_chunk(args):
+    """Worker: convert a chunk of sentences with this process's shared engine"""
+    sentences, tokenizer_mode = args
+    engine = get_engine()  # Built once per worker process, then reused
+    return [engine.convert(sentence, tokenizer_mode) for sentence in sentences]
+
+
+def _chunks(iterable, size):
+    """Yield lists of up to size items from iterable"""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def convert_batch(sentences, tokenizer_mode="fast", workers=None, chunk_size=256):
+    """Convert an iterable of sentences to gloss, yielding results in order
+
+    Each result is the (gloss_string, gloss_json) pair returned by
+    convert_to_sign_gloss. Small inputs are converted in this process; once
+    more than PARALLEL_THRESHOLD sentences are seen the work is spread over a
+    process pool. Results stream as they complete, so the input can be larger
+    than memory.
+    """
+    if tokenizer_mode not in TOKENIZER_MODES:
+        raise ValueError(f"Unknown tokenizer mode: {tokenizer_mode}")
+
+    workers = workers or os.cpu_count() or 1
+    iterator = iter(sentences)
+    head = list(itertools.islice(iterator, PARALLEL_THRESHOLD))
+
+    if len(head) < PARALLEL_THRESHOLD or workers == 1:
+        engine = get_engine()
+        for sentence in itertools.chain(head, iterator):
+            yield engine.convert(sentence, tokenizer_mode)
+        return
+
+    # Feed the pool a bounded window at a time so memory stays flat and the
+    # input iterator is only ever advanced from this thread
+    window_size = chunk_size * workers * 4
+    with multiprocessing.Pool(workers) as pool:
+        for window in _chunks(itertools.chain(head, iterator), window_size):
+            tasks = [(chunk, tokenizer_mode) for chunk in _chunks(window, chunk_size)]
+            for results in pool.imap(_convert_chunk, tasks):
+                yield from results
+
+
+def read_text(f):
+    """Yield one record per non-empty line of a plain text file"""
+    for line in f:
+        line = line.strip()
+        if line:
+            yield {"text": line}
+
+
+def read_srt(f):
+    """Yield one record per subtitle block, with its timing"""
+    block = []
+    for line in itertools.chain(f, [""]):
+        line = line.strip()
+        if line:
+            block.append(line)
+            continue
+        if not block:
+            continue
+
+        # Block layout: index line, "start --> end" line, then text lines
+        record = {}
+        text_lines = block
+        if text_lines and text_lines[0].isdigit():
+            record["index"] = int(text_lines[0])
+            text_lines = text_lines[1:]
+        if text_lines:
+            timing = SRT_TIMING_RE.match(text_lines[0])
+            if timing:
+                record["start"], record["end"] = timing.groups()
+                text_lines = text_lines[1:]
+
+        text = SRT_TAG_RE.sub("", " ".join(text_lines)).strip()
+        if text:
+            record["text"] = text
+            yield record
+        block = []
+
+
+def read_jsonl(f, field="text"):
+    """Yield one record per JSON line, taking the sentence from field"""
+    for line_number, line in enumerate(f, 1):
+        line = line.strip()
+        if not line:
+            continue
+        record = json.loads(line)
+        if field not in record:
+            raise ValueError(f"Line {line_number}: missing '{field}' field")
+        if field != "text":
+            record["text"] = record.pop(field)
+        yield record
+
+
+READERS = {".txt": "text", ".srt": "srt", ".jsonl": "jsonl"}
+
+
+def read_records(f, input_format, field="text"):
+    """Yield records with a "text" key from a text, SRT or JSONL file"""
+    if input_format == "text":
+        return read_text(f)
+    if input_format == "srt":
+        return read_srt(f)
+    if input_format == "jsonl":
+        return read_jsonl(f, field)
+    raise ValueError(f"Unknown input format: {input_format}")
+
+
+def default_tokenizer(input_format):
+    """Return "nltk" for free-form punctuated input (text, SRT) when it is installed, else "fast" """
+    if input_format in ("text", "srt") and nltk_available():
+        return "nltk"
+    return "fast"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert text, SRT or JSONL files to gloss JSONL")
+    parser.add_argument("input", help="input file, or - for stdin")
+    parser.add_argument("-o", "--output", default="-", help="output JSONL file (default: stdout)")
+    parser.add_argument("-f", "--format", choices=["text", "srt", "jsonl"],
+                        help="input format (default: from the file extension)")
+    parser.add_argument("--field", default="text", help="JSONL field holding the sentence")
+    parser.add_argument("-t", "--tokenizer", choices=TOKENIZER_MODES,
+                        help="default: nltk for text and SRT input when available, otherwise fast")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="worker processes for large inputs (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    input_format = args.format or READERS.get(os.path.splitext(args.input)[1].lower(), "text")
+    tokenizer = args.tokenizer or default_tokenizer(input_format)
+
+    infile = sys.stdin if args.input == "-" else open(args.input, "r", encoding="utf-8-sig")
+    outfile = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+
+    count = 0
+    start = time.perf_counter()
+    try:
+        # Records wait here until their gloss comes back, in input order
+        pending = deque()
+
+        def texts():
+            for record in read_records(infile, input_format, args.field):
+                pending.append(record)
+                yield record["text"]
+
+        for gloss_string, gloss_json in convert_batch(texts(), tokenizer, args.workers):
+            record = pending.popleft()
+            record["gloss"] = gloss_string
+            record["gloss_sequence"] = gloss_json["gloss_sequence"]
+            outfile.write(json.dumps(record, ensure_ascii=False) + "\n")
+            count += 1
+    finally:
+        if infile is not sys.stdin:
+            infile.close()
+        if outfile is not sys.stdout:
+            outfile.close()
+
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed if elapsed else 0.0
+    print(f"Converted {count} sentences in {elapsed:.2f}s ({rate:,.0f} sentences/sec)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+import re
+import threading
+from collections import OrderedDict
+
+
+class GlossCache:
+    """Bounded LRU cache for text-to-gloss conversions"""
+
+    def __init__(self, max_size=512):
+        """Initialize an empty cache holding at most max_size segments"""
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+        # Counters exposed through stats()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def normalize(text):
+        """Collapse whitespace and case so equivalent segments share a key"""
+        return re.sub(r'\s+', ' ', text).strip().lower()
+
+    def get_or_convert(self, text, convert):
+        """Return the cached gloss for text, calling convert(key) on a miss"""
+        key = self.normalize(text)
+
+        with self.lock:
+            result = self.entries.get(key)
+            if result is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return result
+            self.misses += 1
+
+        # Convert outside the lock so a slow conversion doesn't block readers
+        result = convert(key)
+
+        with self.lock:
+            self.entries[key] = result
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+        return result
+
+    def clear(self):
+        """Drop all cached entries and reset the counters"""
+        with self.lock:
+            self.entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self):
+        """Return hit/miss/eviction counters and the current size"""
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self.entries),
+                "max_size": self.max_size,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
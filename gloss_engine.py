@@ -0,0 +1,75 @@
+import string
+import threading
+
+from gloss_cache import GlossCache
+from gloss_rules import GlossRules, DEFAULT_RULES_PATH
+from gloss_tokenizer import tokenize, TOKENIZER_MODES
+from nlp_resources import get_gloss_stopwords, get_lemmas
+
+
+class GlossEngine:
+    """Text-to-gloss conversion shared by every front-end
+
+    The stopword set and compiled rule trie are built once and never mutated
+    afterwards, so any number of threads can convert concurrently without
+    locking them. Only the per-mode result caches keep mutable state.
+    """
+
+    def __init__(self, rules_path=DEFAULT_RULES_PATH, cache_size=512):
+        """Load the stopwords and gloss rules and create the result caches"""
+        self.stop_words = get_gloss_stopwords()
+        self.rules = GlossRules.load(rules_path)
+
+        # Inflection -> lemma ("went" -> "go"), minus forms that have their own rule
+        self.lemmas = {form: lemma for form, lemma in get_lemmas().items() if form not in self.rules.trie}
+
+        # One cache per tokenizer mode, since the modes can disagree on a segment
+        self.caches = {mode: GlossCache(cache_size) for mode in TOKENIZER_MODES}
+
+    def convert(self, text, tokenizer_mode="fast"):
+        """Convert text to (gloss_string, gloss_json), using the cache"""
+        if tokenizer_mode not in TOKENIZER_MODES:
+            raise ValueError(f"Unknown tokenizer mode: {tokenizer_mode}")
+        return self.caches[tokenizer_mode].get_or_convert(
+            text, lambda key: self.convert_uncached(key, tokenizer_mode)
+        )
+
+    def convert_uncached(self, text, tokenizer_mode="fast"):
+        """Convert text to (gloss_string, gloss_json) without the cache"""
+        words = tokenize(text, tokenizer_mode)
+        words = [word for word in words if word not in string.punctuation]
+
+        # Reduce inflected words to their lemma so they reach a whole-word sign
+        lemmas = self.lemmas
+        words = [lemmas.get(word, word) for word in words]
+
+        # Longest-match phrase rules first; leftover stopwords are dropped
+        gloss_sequence = self.rules.apply(words, self.stop_words)
+
+        gloss_string = " ".join(gloss_sequence)
+        gloss_json = {"gloss_sequence": gloss_sequence}
+        return gloss_string, gloss_json
+
+    def stats(self, tokenizer_mode="fast"):
+        """Return cache counters for the given tokenizer mode"""
+        return self.caches[tokenizer_mode].stats()
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_engine():
+    """Return the process-wide GlossEngine, building it on first use"""
+    global _engine
+    if _engine is None:
+        # Only the one-time build is serialized; later calls never take the lock
+        with _engine_lock:
+            if _engine is None:
+                _engine = GlossEngine()
+    return _engine
+
+
+def convert_to_sign_gloss(text, tokenizer_mode="fast"):
+    """Convert text to (gloss_string, gloss_json) with the shared engine"""
+    return get_engine().convert(text, tokenizer_mode)
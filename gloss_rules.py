@@ -0,0 +1,163 @@
+import hashlib
+import json
+import os
+import random
+import time
+
+from nlp_resources import DATA_DIR
+
+DEFAULT_RULES_PATH = os.path.join(DATA_DIR, "gloss_rules.json")
+
+# Bump when the compiled layout changes so stale caches are rebuilt
+COMPILE_VERSION = 2
+
+# Trie key marking the end of a phrase; tokens come from str.split() so are never
+# empty, and a string key lets the trie be cached as plain JSON
+END = ""
+
+
+class GlossRules:
+    """Phrase trie compiled from gloss rules, applied by longest match
+
+    Rules map an English word or phrase to a list of gloss tokens, e.g.
+    "thank you" -> ["THANK-YOU"], "won't" -> ["NOT", "WILL"], "am" -> [].
+    """
+
+    def __init__(self, trie, rule_count, max_phrase_len):
+        self.trie = trie
+        self.rule_count = rule_count
+        self.max_phrase_len = max_phrase_len
+
+    @classmethod
+    def compile(cls, rules):
+        """Build a token trie from a {phrase: [gloss tokens]} mapping"""
+        trie = {}
+        max_phrase_len = 0
+
+        for phrase, gloss in rules.items():
+            tokens = phrase.lower().split()
+            if not tokens:
+                raise ValueError("Gloss rule with an empty phrase")
+            if not isinstance(gloss, list) or not all(isinstance(g, str) and g for g in gloss):
+                raise ValueError(f"Gloss rule for '{phrase}' must be a list of gloss tokens")
+
+            node = trie
+            for token in tokens:
+                node = node.setdefault(token, {})
+            node[END] = tuple(gloss)
+            max_phrase_len = max(max_phrase_len, len(tokens))
+
+        return cls(trie, len(rules), max_phrase_len)
+
+    @classmethod
+    def load(cls, path=DEFAULT_RULES_PATH, cache_path=None):
+        """Load rules from a JSON file, reusing the on-disk compiled trie if fresh"""
+        with open(path, "rb") as f:
+            source = f.read()
+        source_hash = hashlib.sha1(source).hexdigest()
+
+        if cache_path is None:
+            cache_path = os.path.splitext(path)[0] + ".trie.json"
+
+        # Reuse the compiled trie if it was built from identical rules. The cache is
+        # plain data (never pickle), so a tampered file can't run code on load
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached.get("version") == COMPILE_VERSION and cached.get("source_hash") == source_hash:
+                return cls(cached["trie"], cached["rule_count"], cached["max_phrase_len"])
+        except (OSError, ValueError, AttributeError, KeyError):
+            pass
+
+        rules = cls.compile(json.loads(source.decode("utf-8"))["rules"])
+
+        # Cache the compiled trie; a read-only install just compiles each time
+        try:
+            with open(cache_path, "w", encoding="utf-8") as f:
+                json.dump({
+                    "version": COMPILE_VERSION,
+                    "source_hash": source_hash,
+                    "trie": rules.trie,
+                    "rule_count": rules.rule_count,
+                    "max_phrase_len": rules.max_phrase_len
+                }, f, separators=(",", ":"))
+        except OSError as e:
+            print(f"Could not cache compiled gloss rules: {e}")
+
+        return rules
+
+    def apply(self, tokens, stop_words=frozenset()):
+        """Convert tokens to gloss in one left-to-right longest-match pass
+
+        Matched phrases emit their gloss tokens (possibly none). Unmatched
+        stopwords are dropped and any other word is glossed as itself.
+        """
+        gloss = []
+        trie = self.trie
+        count = len(tokens)
+        i = 0
+
+        while i < count:
+            # Walk the trie as far as the input allows, remembering the last match
+            node = trie
+            match = None
+            match_end = i
+            j = i
+            while j < count:
+                node = node.get(tokens[j])
+                if node is None:
+                    break
+                j += 1
+                if END in node:
+                    match = node[END]
+                    match_end = j
+
+            if match is not None:
+                gloss.extend(match)
+                i = match_end
+            else:
+                word = tokens[i]
+                if word not in stop_words:
+                    gloss.append(word.upper())
+                i += 1
+
+        return gloss
+
+
+def benchmark(rule_count, sentences, repeat=5):
+    """Return tokens per second for a synthetic rule set of rule_count entries"""
+    rng = random.Random(rule_count)
+    vocabulary = [word for sentence in sentences for word in sentence]
+
+    # Real rules first, then synthetic words and phrases up to rule_count
+    with open(DEFAULT_RULES_PATH, "r", encoding="utf-8") as f:
+        rules = dict(json.load(f)["rules"])
+    while len(rules) < rule_count:
+        length = rng.choice((1, 1, 2, 3))
+        phrase = " ".join(rng.choice(vocabulary) if rng.random() < 0.3 else f"w{rng.randrange(10 ** 6)}"
+                          for _ in range(length))
+        rules[phrase] = [phrase.upper().replace(" ", "-")]
+    compiled = GlossRules.compile(rules)
+
+    token_count = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for sentence in sentences:
+            compiled.apply(sentence)
+            token_count += len(sentence)
+    elapsed = time.perf_counter() - start
+
+    return token_count / elapsed if elapsed else 0.0
+
+
+# Show that throughput holds as the rule set grows
+if __name__ == "__main__":
+    sample = [
+        "i don't want to go to the store".split(),
+        "thank you how are you doing today".split(),
+        "we won't have milk because she is going there".split(),
+        "nice to meet you see you later".split(),
+    ] * 250
+
+    for size in (50, 1000, 10000, 50000):
+        print(f"{size:>6} rules: {benchmark(size, sample):,.0f} tokens/sec")
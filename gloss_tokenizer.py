@@ -0,0 +1,88 @@
+import re
+import time
+
+from nlp_resources import get_nltk
+
+# Vosk emits lowercase words separated by spaces; the only punctuation it
+# produces is the apostrophe inside contractions ("don't", "won't", "i'm").
+# Digits are accepted too so hand-typed text degrades gracefully.
+VOSK_TOKEN_RE = re.compile(r"[a-z0-9]+(?:'[a-z]+)*")
+
+# Typographic apostrophes (common in subtitles and typed text) mapped to "'";
+# otherwise "don’t" splits into "don" + "t", both stopwords, and the negation is lost
+APOSTROPHES = str.maketrans({"\u2019": "'", "\u2018": "'", "\u02bc": "'"})
+
+# Clitics that NLTK's Treebank tokenizer splits off the preceding word
+NLTK_CLITICS = {"n't", "'s", "'m", "'re", "'ve", "'ll", "'d"}
+
+# Available tokenizer modes; "fast" is the default for recognizer output
+TOKENIZER_MODES = ("fast", "nltk")
+
+
+def fast_tokenize(text):
+    """Split recognizer output into words, keeping contractions whole"""
+    return VOSK_TOKEN_RE.findall(text.lower().translate(APOSTROPHES))
+
+
+def nltk_tokenize(text):
+    """Tokenize free-form text with NLTK, re-joining split contractions"""
+    nltk = get_nltk()
+
+    tokens = []
+    for token in nltk.word_tokenize(text.lower().translate(APOSTROPHES)):
+        # "won't" comes back as "wo" + "n't"; glue it back so the gloss rules match
+        if token in NLTK_CLITICS and tokens:
+            tokens[-1] += token
+        else:
+            tokens.append(token)
+
+    return tokens
+
+
+def nltk_available():
+    """Return True if NLTK and its tokenizer data can be loaded"""
+    try:
+        nltk_tokenize("ok")
+    except (ImportError, LookupError):
+        return False
+    return True
+
+
+def tokenize(text, mode="fast"):
+    """Tokenize text using the given mode ("fast" or "nltk")"""
+    if mode == "fast":
+        return fast_tokenize(text)
+    if mode == "nltk":
+        return nltk_tokenize(text)
+    raise ValueError(f"Unknown tokenizer mode: {mode}")
+
+
+def benchmark(sentences, mode, repeat=5):
+    """Return tokens per second for tokenizing sentences in the given mode"""
+    tokenize(sentences[0], mode)  # Warm up (NLTK loads Punkt on first use)
+
+    token_count = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for sentence in sentences:
+            token_count += len(tokenize(sentence, mode))
+    elapsed = time.perf_counter() - start
+
+    return token_count / elapsed if elapsed else 0.0
+
+
+# Benchmark both tokenizers on recognizer-style text
+if __name__ == "__main__":
+    sample = [
+        "i don't want to go to the store",
+        "we won't have milk because she is going there",
+        "how are you doing today i'm fine thank you",
+        "they can't help us but he should",
+    ] * 250
+
+    for mode in TOKENIZER_MODES:
+        try:
+            rate = benchmark(sample, mode)
+            print(f"{mode:>5}: {rate:,.0f} tokens/sec")
+        except (ImportError, LookupError) as e:
+            print(f"{mode:>5}: unavailable ({e})")
@@ -0,0 +1,61 @@
+import os
+
+# NLP data shipped with the repository, so nothing is fetched at run time
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+STOPWORDS_PATH = os.path.join(DATA_DIR, "stopwords_english.txt")
+LEMMAS_PATH = os.path.join(DATA_DIR, "lemmas.tsv")
+
+# Optional local NLTK data (e.g. tokenizers/punkt) for the "nltk" tokenizer
+NLTK_DATA_DIR = os.path.join(DATA_DIR, "nltk_data")
+
+# Pronouns carry meaning in sign gloss, so they are never treated as stopwords
+KEPT_PRONOUNS = frozenset({
+    'i', 'you', 'we', 'he', 'she', 'they', 'me', 'my', 'your', 'our', 'his', 'her', 'their'
+})
+
+_stopwords = None
+_gloss_stopwords = None
+_lemmas = None
+_nltk = None
+
+
+def get_stopwords():
+    """Return the bundled English stopword set, reading it on first use"""
+    global _stopwords
+    if _stopwords is None:
+        with open(STOPWORDS_PATH, "r", encoding="utf-8") as f:
+            _stopwords = frozenset(line.strip() for line in f if line.strip())
+    return _stopwords
+
+
+def get_gloss_stopwords():
+    """Return the stopwords to drop during glossing (pronouns kept)"""
+    global _gloss_stopwords
+    if _gloss_stopwords is None:
+        _gloss_stopwords = get_stopwords() - KEPT_PRONOUNS
+    return _gloss_stopwords
+
+
+def get_lemmas():
+    """Return the precomputed inflection -> lemma table, reading it on first use"""
+    global _lemmas
+    if _lemmas is None:
+        with open(LEMMAS_PATH, "r", encoding="utf-8") as f:
+            _lemmas = dict(line.rstrip("\n").split("\t") for line in f if line.strip())
+    return _lemmas
+
+
+def get_nltk():
+    """Import NLTK on first use, pointing it at local data only
+
+    Never calls nltk.download(); on air-gapped machines a missing resource
+    raises LookupError instead of hanging on network access.
+    """
+    global _nltk
+    if _nltk is None:
+        import nltk
+
+        if os.path.isdir(NLTK_DATA_DIR) and NLTK_DATA_DIR not in nltk.data.path:
+            nltk.data.path.insert(0, NLTK_DATA_DIR)
+        _nltk = nltk
+    return _nltk
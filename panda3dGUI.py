@@ -17,19 +17,8 @@ from panda3d.core import *
 from vosk import Model, KaldiRecognizer
 import pyaudio
 
-# Import NLP tools
-import nltk
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
-import string
-
-# Ensure NLTK resources are downloaded
-try:
-    nltk.data.find('tokenizers/punkt')
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('punkt')
-    nltk.download('stopwords')
+# Shared text-to-gloss engine (bundled data, nothing is downloaded)
+from gloss_engine import get_engine
 
 
 class SpeechRecognitionApp(ShowBase):
@@ -83,25 +72,7 @@ class SpeechRecognitionApp(ShowBase):
         self.recognition_active = True
         self.min_similarity_threshold = 0.7
 
-        # Stopwords with pronouns kept
-        self.stop_words = set(stopwords.words('english')) - {
-            'i', 'you', 'we', 'he', 'she', 'they', 'me', 'my', 'your', 'our', 'his', 'her', 'their'
-        }
-
-        # Gloss mapping for sign language
-        self.gloss_map = {
-            "i": "ME", "you": "YOU", "we": "US", "he": "HE", "she": "SHE", "they": "THEY",
-            "am": "", "is": "", "are": "", "was": "", "were": "",
-            "going": "GO", "go": "GO", "want": "WANT", "have": "HAVE", "had": "HAVE",
-            "don't": "NOT", "not": "NOT", "no": "NOT", "won't": "NOT WILL",
-            "store": "STORE", "because": "WHY", "milk": "MILK", "to": "",
-            "the": "", "a": "", "an": "", "and": "PLUS", "but": "BUT",
-            "this": "THIS", "that": "THAT", "there": "THERE", "here": "HERE",
-            "what": "WHAT", "who": "WHO", "where": "WHERE", "when": "WHEN", "why": "WHY", "how": "HOW",
-            "need": "NEED", "can": "CAN", "will": "WILL", "should": "SHOULD", "must": "MUST",
-            "good": "GOOD", "bad": "BAD", "happy": "HAPPY", "sad": "SAD",
-            "yes": "YES", "okay": "OK", "like": "LIKE", "help": "HELP"
-        }
+        self.gloss_engine = get_engine()
 
         # Start listening thread if setup was successful
         if self.setup_successful:
@@ -611,19 +582,7 @@ class SpeechRecognitionApp(ShowBase):
 
     def convert_to_sign_gloss(self, text):
         """Convert normal text to sign language gloss notation"""
-        words = word_tokenize(text.lower())
-        words = [word for word in words if word not in string.punctuation]
-        filtered = [word for word in words if word not in self.stop_words or word.lower() in self.gloss_map]
-
-        gloss_sequence = []
-        for word in filtered:
-            gloss_word = self.gloss_map.get(word.lower(), word.upper())
-            if gloss_word:  # Only add non-empty strings
-                gloss_sequence.append(gloss_word)
-
-        gloss_string = " ".join(gloss_sequence)
-        gloss_json = {"gloss_sequence": gloss_sequence}
-        return gloss_string, gloss_json
+        return self.gloss_engine.convert(text)
 
     def listen(self):
         """Main listening function that processes audio and updates transcript"""